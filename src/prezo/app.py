@@ -142,6 +142,52 @@ def count_list_items(content: str) -> int:
     return count
 
 
+def _next_reveal_or_slide(
+    current_slide: int, reveal_index: int, list_count: int, total_slides: int
+) -> tuple[int, int]:
+    """Compute the position reached by a "next" action.
+
+    Args:
+        current_slide: Index of the current slide.
+        reveal_index: Index of the last revealed list item (-1 = show all).
+        list_count: Number of list items revealed one by one on the current
+            slide (0 when incremental mode is disabled for it).
+        total_slides: Number of slides in the presentation.
+
+    Returns:
+        (slide, reveal_index) tuple. When the slide changes, reveal_index is
+        returned unchanged; it is initialized for the new slide by the caller.
+
+    """
+    if 0 <= reveal_index < list_count - 1:
+        return current_slide, reveal_index + 1
+    if current_slide < total_slides - 1:
+        return current_slide + 1, reveal_index
+    return current_slide, reveal_index
+
+
+def _prev_reveal_or_slide(
+    current_slide: int, reveal_index: int, *, incremental: bool
+) -> tuple[int, int]:
+    """Compute the position reached by a "previous" action.
+
+    Args:
+        current_slide: Index of the current slide.
+        reveal_index: Index of the last revealed list item (-1 = show all).
+        incremental: Whether incremental mode is enabled for the current slide.
+
+    Returns:
+        (slide, reveal_index) tuple. When the slide changes, reveal_index is
+        returned unchanged; it is initialized for the new slide by the caller.
+
+    """
+    if incremental and reveal_index > 0:
+        return current_slide, reveal_index - 1
+    if current_slide > 0:
+        return current_slide - 1, reveal_index
+    return current_slide, reveal_index
+
+
 # Braille Pattern Blank - invisible character with width, behaves like text for layout
 _INVISIBLE_CHAR = "\u2800"
 
@@ -228,6 +274,37 @@ def filter_list_items(content: str, max_items: int) -> str:
 class PrezoCommands(Provider):
     """Command provider for Prezo actions."""
 
+    # (name, action, description) for every palette command, built once
+    COMMAND_TABLE: ClassVar[tuple[tuple[str, str, str], ...]] = (
+        # Navigation commands
+        ("Next Slide", "next_slide", "Go to the next slide (→/j/Space)"),
+        ("Previous Slide", "prev_slide", "Go to the previous slide (←/k)"),
+        ("First Slide", "first_slide", "Go to the first slide (Home/g)"),
+        ("Last Slide", "last_slide", "Go to the last slide (End/G)"),
+        ("Go to Slide...", "goto_slide", "Jump to a specific slide number (:)"),
+        # View commands
+        ("Slide Overview", "show_overview", "Show grid overview of all slides (o)"),
+        ("Table of Contents", "show_toc", "Show table of contents (t)"),
+        ("Search Slides", "search", "Search slides by content (/)"),
+        ("Toggle Notes", "toggle_notes", "Show/hide presenter notes (p)"),
+        ("Toggle Clock", "toggle_clock", "Cycle clock display mode (c)"),
+        ("Help", "show_help", "Show keyboard shortcuts (?)"),
+        # Theme commands
+        ("Cycle Theme", "cycle_theme", "Switch to next theme (T)"),
+        ("Theme: Dark", "set_theme_dark", "Switch to dark theme"),
+        ("Theme: Light", "set_theme_light", "Switch to light theme"),
+        ("Theme: Dracula", "set_theme_dracula", "Switch to dracula theme"),
+        ("Theme: Nord", "set_theme_nord", "Switch to nord theme"),
+        ("Theme: Gruvbox", "set_theme_gruvbox", "Switch to gruvbox theme"),
+        # Screen commands
+        ("Blackout Screen", "blackout", "Show black screen (b)"),
+        ("Whiteout Screen", "whiteout", "Show white screen (w)"),
+        # File commands
+        ("Reload Presentation", "reload", "Reload the presentation file (r)"),
+        ("Edit Slide", "edit_slide", "Edit current slide in editor (e)"),
+        ("Quit", "quit", "Exit Prezo (q)"),
+    )
+
     @property
     def _app(self) -> PrezoApp:
         """Get the app instance."""
@@ -237,61 +314,7 @@ class PrezoCommands(Provider):
         """Search for matching commands."""
         matcher = self.matcher(query)
 
-        # Navigation commands
-        commands = [
-            ("Next Slide", "next_slide", "Go to the next slide (→/j/Space)"),
-            ("Previous Slide", "prev_slide", "Go to the previous slide (←/k)"),
-            ("First Slide", "first_slide", "Go to the first slide (Home/g)"),
-            ("Last Slide", "last_slide", "Go to the last slide (End/G)"),
-            ("Go to Slide...", "goto_slide", "Jump to a specific slide number (:)"),
-        ]
-
-        # View commands
-        commands.extend(
-            [
-                (
-                    "Slide Overview",
-                    "show_overview",
-                    "Show grid overview of all slides (o)",
-                ),
-                ("Table of Contents", "show_toc", "Show table of contents (t)"),
-                ("Search Slides", "search", "Search slides by content (/)"),
-                ("Toggle Notes", "toggle_notes", "Show/hide presenter notes (p)"),
-                ("Toggle Clock", "toggle_clock", "Cycle clock display mode (c)"),
-                ("Help", "show_help", "Show keyboard shortcuts (?)"),
-            ]
-        )
-
-        # Theme commands
-        commands.extend(
-            [
-                ("Cycle Theme", "cycle_theme", "Switch to next theme (T)"),
-                ("Theme: Dark", "set_theme_dark", "Switch to dark theme"),
-                ("Theme: Light", "set_theme_light", "Switch to light theme"),
-                ("Theme: Dracula", "set_theme_dracula", "Switch to dracula theme"),
-                ("Theme: Nord", "set_theme_nord", "Switch to nord theme"),
-                ("Theme: Gruvbox", "set_theme_gruvbox", "Switch to gruvbox theme"),
-            ]
-        )
-
-        # Screen commands
-        commands.extend(
-            [
-                ("Blackout Screen", "blackout", "Show black screen (b)"),
-                ("Whiteout Screen", "whiteout", "Show white screen (w)"),
-            ]
-        )
-
-        # File commands
-        commands.extend(
-            [
-                ("Reload Presentation", "reload", "Reload the presentation file (r)"),
-                ("Edit Slide", "edit_slide", "Edit current slide in editor (e)"),
-                ("Quit", "quit", "Exit Prezo (q)"),
-            ]
-        )
-
-        for name, action, description in commands:
+        for name, action, description in self.COMMAND_TABLE:
             score = matcher.match(name)
             if score > 0:
                 yield Hit(
@@ -870,39 +893,36 @@ class PrezoApp(App):
         if not self.presentation:
             return
 
-        # Check if we should reveal next item instead of advancing slide
-        if self._is_incremental_enabled():
-            list_count = self._get_list_count()
-            if (
-                list_count > 0
-                and self.reveal_index >= 0
-                and self.reveal_index < list_count - 1
-            ):
-                self.reveal_index += 1
-                self._update_display()
-                self._update_progress_bar()
-                return
-
-        # No more items to reveal, go to next slide
-        if self.current_slide < self.presentation.total_slides - 1:
-            # The watcher will initialize reveal_index for the new slide
-            self.current_slide += 1
+        list_count = self._get_list_count() if self._is_incremental_enabled() else 0
+        slide, reveal = _next_reveal_or_slide(
+            self.current_slide,
+            self.reveal_index,
+            list_count,
+            self.presentation.total_slides,
+        )
+        self._move_to(slide, reveal)
 
     def action_prev_slide(self) -> None:
         """Go to the previous slide or hide last revealed item."""
         if not self.presentation:
             return
 
-        # Check if we should hide last item instead of going back
-        if self._is_incremental_enabled() and self.reveal_index > 0:
-            self.reveal_index -= 1
+        slide, reveal = _prev_reveal_or_slide(
+            self.current_slide,
+            self.reveal_index,
+            incremental=self._is_incremental_enabled(),
+        )
+        self._move_to(slide, reveal)
+
+    def _move_to(self, slide: int, reveal: int) -> None:
+        """Apply a position computed by a next/previous action."""
+        if slide != self.current_slide:
+            # The watcher will initialize reveal_index for the new slide
+            self.current_slide = slide
+        elif reveal != self.reveal_index:
+            self.reveal_index = reveal
             self._update_display()
             self._update_progress_bar()
-            return
-
-        # Go to previous slide (watcher will show all items)
-        if self.current_slide > 0:
-            self.current_slide -= 1
 
     def action_first_slide(self) -> None:
         """Go to the first slide."""
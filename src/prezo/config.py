@@ -5,7 +5,10 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
 
 # Try to import tomllib (Python 3.11+) or tomli as fallback
 try:
@@ -151,6 +154,20 @@ class AppState:
         # Trim to max
         self.recent_files = self.recent_files[:max_files]
 
+    def add_recent_files(self, paths: Iterable[str], max_files: int = 20) -> None:
+        """Add several files to recent files list in one pass.
+
+        The last path ends up first, as if each were added in order with
+        ``add_recent_file``. The whole list is then deduplicated, keeping
+        the newest entry, and trimmed to ``max_files``. Does nothing when
+        ``paths`` is empty.
+        """
+        new_paths = list(paths)
+        if not new_paths:
+            return
+        newest_first = [*reversed(new_paths), *self.recent_files]
+        self.recent_files = list(dict.fromkeys(newest_first))[:max_files]
+
     def set_position(self, path: str, position: int) -> None:
         """Save last position for a file."""
         self.last_positions[path] = position
@@ -4,7 +4,8 @@ from __future__ import annotations
 
 import contextlib
 import re
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -443,18 +444,13 @@ def _parse_content(text: str, source_path: Path | None) -> Presentation:
     )
 
     for i, raw_slide in enumerate(split_slides(post.content)):
-        slide_content, notes = extract_notes(raw_slide)
-        # Extract images BEFORE cleaning (clean_marp_directives removes bg images)
-        images = extract_images(slide_content)
-        # Extract per-slide incremental setting
-        incremental = extract_slide_incremental(slide_content)
-        cleaned_content = clean_marp_directives(slide_content).strip()
+        cleaned_content, notes, images, incremental = _parse_slide(raw_slide)
         slide = Slide(
             content=cleaned_content,
             index=i,
             raw_content=raw_slide,
-            notes=notes.strip(),
-            images=images,
+            notes=notes,
+            images=[replace(image) for image in images],
             incremental=incremental,
         )
         presentation.slides.append(slide)
@@ -462,6 +458,25 @@ def _parse_content(text: str, source_path: Path | None) -> Presentation:
     return presentation
 
 
+@lru_cache(maxsize=512)
+def _parse_slide(
+    raw_slide: str,
+) -> tuple[str, str, tuple[ImageRef, ...], bool | None]:
+    """Parse one slide's source into (content, notes, images, incremental).
+
+    Cached on the slide text, so reloading a presentation only re-parses the
+    slides that changed. The cached ``ImageRef`` objects are shared between
+    calls: callers must copy them before handing them out.
+    """
+    slide_content, notes = extract_notes(raw_slide)
+    # Extract images BEFORE cleaning (clean_marp_directives removes bg images)
+    images = extract_images(slide_content)
+    # Extract per-slide incremental setting
+    incremental = extract_slide_incremental(slide_content)
+    cleaned_content = clean_marp_directives(slide_content).strip()
+    return cleaned_content, notes.strip(), tuple(images), incremental
+
+
 def _extract_raw_frontmatter(text: str, metadata: dict) -> str:
     """Extract raw frontmatter text for reconstruction."""
     if not metadata or not text.startswith("---"):
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, fields
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Theme:
     """A color theme for the presentation viewer."""
 
@@ -97,7 +98,43 @@ THEMES: dict[str, Theme] = {
     ),
 }
 
-THEME_ORDER = ["dark", "light", "dracula", "solarized-dark", "nord", "gruvbox"]
+THEME_ORDER = ("dark", "light", "dracula", "solarized-dark", "nord", "gruvbox")
+
+# Theme that follows each theme when cycling, wrapping around at the end
+_NEXT_THEME = {
+    name: THEME_ORDER[(idx + 1) % len(THEME_ORDER)]
+    for idx, name in enumerate(THEME_ORDER)
+}
+
+
+_HEX_COLOR = re.compile(r"#[0-9a-fA-F]{6}")
+
+
+def _check_colors(theme: Theme) -> None:
+    """Check that every color of a theme is a ``#rrggbb`` hex string.
+
+    Raises:
+        ValueError: If a color is not a hex color.
+
+    """
+    for color_field in fields(theme):
+        if color_field.name == "name":
+            continue
+        value = getattr(theme, color_field.name)
+        if not _HEX_COLOR.fullmatch(value):
+            msg = f"{theme.name}.{color_field.name} is not a hex color: {value!r}"
+            raise ValueError(msg)
+
+
+def _check_builtin_themes() -> None:
+    """Check the colors of every built-in theme."""
+    for theme in THEMES.values():
+        _check_colors(theme)
+
+
+# Validate the built-in themes once, at import
+if __debug__:
+    _check_builtin_themes()
 
 
 def get_theme(name: str) -> Theme:
@@ -107,11 +144,7 @@ def get_theme(name: str) -> Theme:
 
 def get_next_theme(current: str) -> str:
     """Get the next theme name in the cycle."""
-    try:
-        idx = THEME_ORDER.index(current)
-        return THEME_ORDER[(idx + 1) % len(THEME_ORDER)]
-    except ValueError:
-        return THEME_ORDER[0]
+    return _NEXT_THEME.get(current, THEME_ORDER[0])
 
 
 def theme_to_css(theme: Theme) -> str:
@@ -8,6 +8,15 @@ from textual.widgets import Button
 
 MAX_TITLE_LENGTH = 35
 
+# Headings are cut to this many characters before emphasis markers are
+# stripped, so very long titles don't get scanned in full.  The whole heading
+# is stripped instead when the cut splits an emphasis span, or when markers
+# leave too little text in the prefix to fill MAX_TITLE_LENGTH.
+_TITLE_SCAN_LENGTH = 2 * MAX_TITLE_LENGTH
+
+_HEADING_PATTERN = re.compile(r"^(#{1,6})\s+(.+)$")
+_EMPHASIS_PATTERN = re.compile(r"\*{1,2}([^*]+)\*{1,2}")
+
 
 def extract_slide_title(content: str, slide_index: int) -> str:
     """Extract the first heading (any level) from slide content.
@@ -22,11 +31,9 @@ def extract_slide_title(content: str, slide_index: int) -> str:
     """
     for line in content.strip().split("\n"):
         line = line.strip()
-        match = re.match(r"^(#{1,6})\s+(.+)$", line)
+        match = _HEADING_PATTERN.match(line)
         if match:
-            title = match.group(2).strip()
-            title = re.sub(r"\*{1,2}([^*]+)\*{1,2}", r"\1", title)
-            return _truncate(title)
+            return _truncate(_strip_emphasis(match.group(2).strip()))
 
     for line in content.strip().split("\n"):
         line = line.strip()
@@ -36,6 +43,17 @@ def extract_slide_title(content: str, slide_index: int) -> str:
     return f"Slide {slide_index + 1}"
 
 
+def _strip_emphasis(heading: str) -> str:
+    """Strip emphasis markers, scanning only as much of the heading as needed."""
+    title = _EMPHASIS_PATTERN.sub(r"\1", heading[:_TITLE_SCAN_LENGTH])
+    if len(heading) > _TITLE_SCAN_LENGTH and (
+        "*" in title or len(title) <= MAX_TITLE_LENGTH
+    ):
+        # The prefix alone can't give the right title
+        title = _EMPHASIS_PATTERN.sub(r"\1", heading)
+    return title
+
+
 def _truncate(text: str) -> str:
     """Truncate text to MAX_TITLE_LENGTH with ellipsis if needed."""
     if len(text) > MAX_TITLE_LENGTH:
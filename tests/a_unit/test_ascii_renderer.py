@@ -13,6 +13,9 @@ from prezo.images.ascii import (
     render_cached,
 )
 
+# Image file name too long for any placeholder box
+_LONG_NAME = "a" * 100 + ".png"
+
 
 class TestAsciiRenderer:
     """Tests for AsciiRenderer class."""
@@ -44,27 +47,22 @@ class TestAsciiRenderer:
 
     def test_render_placeholder_truncates_long_filename(self, tmp_path):
         renderer = AsciiRenderer()
-        long_name = "a" * 100 + ".png"
-        fake_path = tmp_path / long_name
+        fake_path = tmp_path / _LONG_NAME
         result = renderer._render_placeholder(fake_path, 40, 10)
 
         # Should truncate with ellipsis
         assert "..." in result
         # Filename should be truncated, not the full 100+ chars
-        assert long_name not in result
+        assert _LONG_NAME not in result
 
     @pytest.fixture
     def simple_image(self, tmp_path):
         """Create a simple test image."""
-        try:
-            from PIL import Image
-
-            img = Image.new("RGB", (100, 100), color="gray")
-            path = tmp_path / "test.png"
-            img.save(path)
-            return path
-        except ImportError:
-            pytest.skip("PIL not available")
+        pil_image = pytest.importorskip("PIL.Image", reason="PIL not available")
+        img = pil_image.new("RGB", (100, 100), color="gray")
+        path = tmp_path / "test.png"
+        img.save(path)
+        return path
 
     def test_render_real_image(self, simple_image):
         renderer = AsciiRenderer()
@@ -101,15 +99,11 @@ class TestColorAsciiRenderer:
     @pytest.fixture
     def color_image(self, tmp_path):
         """Create a colored test image."""
-        try:
-            from PIL import Image
-
-            img = Image.new("RGB", (50, 50), color="red")
-            path = tmp_path / "color.png"
-            img.save(path)
-            return path
-        except ImportError:
-            pytest.skip("PIL not available")
+        pil_image = pytest.importorskip("PIL.Image", reason="PIL not available")
+        img = pil_image.new("RGB", (50, 50), color="red")
+        path = tmp_path / "color.png"
+        img.save(path)
+        return path
 
     def test_render_produces_ansi_escape_codes(self, color_image):
         renderer = ColorAsciiRenderer()
@@ -146,18 +140,14 @@ class TestHalfBlockRenderer:
     @pytest.fixture
     def gradient_image(self, tmp_path):
         """Create a gradient test image."""
-        try:
-            from PIL import Image
-
-            img = Image.new("RGB", (100, 100))
-            for y in range(100):
-                for x in range(100):
-                    img.putpixel((x, y), (x * 2, y * 2, 128))
-            path = tmp_path / "gradient.png"
-            img.save(path)
-            return path
-        except ImportError:
-            pytest.skip("PIL not available")
+        pil_image = pytest.importorskip("PIL.Image", reason="PIL not available")
+        img = pil_image.new("RGB", (100, 100))
+        for y in range(100):
+            for x in range(100):
+                img.putpixel((x, y), (x * 2, y * 2, 128))
+        path = tmp_path / "gradient.png"
+        img.save(path)
+        return path
 
     def test_render_uses_half_block_character(self, gradient_image):
         renderer = HalfBlockRenderer()
@@ -182,15 +172,11 @@ class TestRenderCached:
     @pytest.fixture
     def test_image(self, tmp_path):
         """Create a test image."""
-        try:
-            from PIL import Image
-
-            img = Image.new("RGB", (50, 50), color="blue")
-            path = tmp_path / "cache_test.png"
-            img.save(path)
-            return path
-        except ImportError:
-            pytest.skip("PIL not available")
+        pil_image = pytest.importorskip("PIL.Image", reason="PIL not available")
+        img = pil_image.new("RGB", (50, 50), color="blue")
+        path = tmp_path / "cache_test.png"
+        img.save(path)
+        return path
 
     def test_ascii_renderer_type(self, test_image):
         result = render_cached("ascii", str(test_image), 20, 10)
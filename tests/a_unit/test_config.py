@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+from operator import attrgetter
+
+import pytest
+
 from prezo.config import (
     AppState,
     BehaviorConfig,
@@ -12,6 +16,8 @@ from prezo.config import (
     TimerConfig,
 )
 
+RECENT_PATHS = [f"/path/to/file{i}.md" for i in range(25)]
+
 
 class TestDisplayConfig:
     def test_default_values(self):
@@ -107,33 +113,33 @@ class TestConfig:
 class TestConfigUpdateFromDict:
     """Tests for Config.update_from_dict method with various sections."""
 
-    def test_update_timer_config(self):
-        config = Config()
-        config.update_from_dict(
-            {"timer": {"show_clock": False, "countdown_minutes": 45}}
-        )
-        assert config.timer.show_clock is False
-        assert config.timer.countdown_minutes == 45
-
-    def test_update_behavior_config(self):
-        config = Config()
-        config.update_from_dict(
-            {"behavior": {"auto_reload": False, "reload_interval": 5.0}}
-        )
-        assert config.behavior.auto_reload is False
-        assert config.behavior.reload_interval == 5.0
-
-    def test_update_export_config(self):
-        config = Config()
-        config.update_from_dict({"export": {"default_theme": "dark", "chrome": False}})
-        assert config.export.default_theme == "dark"
-        assert config.export.chrome is False
-
-    def test_update_images_config(self):
+    @pytest.mark.parametrize(
+        ("patch", "expected"),
+        [
+            (
+                {"timer": {"show_clock": False, "countdown_minutes": 45}},
+                {"timer.show_clock": False, "timer.countdown_minutes": 45},
+            ),
+            (
+                {"behavior": {"auto_reload": False, "reload_interval": 5.0}},
+                {"behavior.auto_reload": False, "behavior.reload_interval": 5.0},
+            ),
+            (
+                {"export": {"default_theme": "dark", "chrome": False}},
+                {"export.default_theme": "dark", "export.chrome": False},
+            ),
+            (
+                {"images": {"mode": "kitty", "ascii_width": 80}},
+                {"images.mode": "kitty", "images.ascii_width": 80},
+            ),
+        ],
+        ids=["timer", "behavior", "export", "images"],
+    )
+    def test_update_section(self, patch, expected):
         config = Config()
-        config.update_from_dict({"images": {"mode": "kitty", "ascii_width": 80}})
-        assert config.images.mode == "kitty"
-        assert config.images.ascii_width == 80
+        config.update_from_dict(patch)
+        for attr_path, value in expected.items():
+            assert attrgetter(attr_path)(config) == value, attr_path
 
     def test_update_unknown_keys_ignored(self):
         config = Config()
@@ -187,11 +193,34 @@ class TestAppState:
 
     def test_add_recent_file_limits_size(self):
         state = AppState()
-        for i in range(25):
-            state.add_recent_file(f"/path/to/file{i}.md")
+        for path in RECENT_PATHS:
+            state.add_recent_file(path)
 
         assert len(state.recent_files) == 20  # Default max
 
+    def test_add_recent_files_matches_one_by_one(self):
+        paths = [*RECENT_PATHS, RECENT_PATHS[3]]  # Re-add moves to front
+        one_by_one = AppState(recent_files=["/old.md"])
+        for path in paths:
+            one_by_one.add_recent_file(path)
+
+        batched = AppState(recent_files=["/old.md"])
+        batched.add_recent_files(paths)
+
+        assert batched.recent_files == one_by_one.recent_files
+        assert batched.recent_files[0] == RECENT_PATHS[3]
+        assert len(batched.recent_files) == 20
+
+    def test_add_recent_files_custom_max(self):
+        state = AppState()
+        state.add_recent_files(RECENT_PATHS, max_files=5)
+        assert state.recent_files == RECENT_PATHS[:-6:-1]
+
+    def test_add_recent_files_empty_leaves_list_untouched(self):
+        state = AppState(recent_files=list(RECENT_PATHS))
+        state.add_recent_files([])
+        assert state.recent_files == RECENT_PATHS
+
     def test_set_and_get_position(self):
         state = AppState()
         state.set_position("/path/to/file.md", 5)
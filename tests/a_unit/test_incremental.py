@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
-from prezo.app import count_list_items, filter_list_items
+from prezo.app import (
+    _next_reveal_or_slide,
+    _prev_reveal_or_slide,
+    count_list_items,
+    filter_list_items,
+)
 
 
 class TestCountListItems:
@@ -206,3 +211,51 @@ More text here
         # Others hidden but lines preserved
         assert "- Second item" not in result
         assert "- Third item" not in result
+
+
+class TestNextRevealOrSlide:
+    """Tests for _next_reveal_or_slide function."""
+
+    def test_reveals_next_item(self):
+        """Test that the next hidden item is revealed first."""
+        assert _next_reveal_or_slide(0, 0, 3, 3) == (0, 1)
+        assert _next_reveal_or_slide(0, 1, 3, 3) == (0, 2)
+
+    def test_advances_when_all_items_revealed(self):
+        """Test moving to the next slide after the last item."""
+        assert _next_reveal_or_slide(0, 2, 3, 3) == (1, 2)
+
+    def test_advances_when_showing_all(self):
+        """Test that reveal_index -1 (show all) goes to the next slide."""
+        assert _next_reveal_or_slide(1, -1, 3, 3) == (2, -1)
+
+    def test_advances_without_list_items(self):
+        """Test slides without list items (or incremental off) advance."""
+        assert _next_reveal_or_slide(0, 0, 0, 3) == (1, 0)
+
+    def test_stays_on_last_slide(self):
+        """Test that nothing happens past the last item of the last slide."""
+        assert _next_reveal_or_slide(2, -1, 0, 3) == (2, -1)
+        assert _next_reveal_or_slide(2, 2, 3, 3) == (2, 2)
+
+
+class TestPrevRevealOrSlide:
+    """Tests for _prev_reveal_or_slide function."""
+
+    def test_hides_last_revealed_item(self):
+        """Test that the last revealed item is hidden first."""
+        assert _prev_reveal_or_slide(1, 2, incremental=True) == (1, 1)
+        assert _prev_reveal_or_slide(1, 1, incremental=True) == (1, 0)
+
+    def test_goes_back_from_first_item(self):
+        """Test moving to the previous slide when only one item is shown."""
+        assert _prev_reveal_or_slide(1, 0, incremental=True) == (0, 0)
+
+    def test_goes_back_when_not_incremental(self):
+        """Test that reveal state is ignored when incremental is off."""
+        assert _prev_reveal_or_slide(1, 2, incremental=False) == (0, 2)
+
+    def test_stays_on_first_slide(self):
+        """Test that nothing happens before the first slide."""
+        assert _prev_reveal_or_slide(0, -1, incremental=False) == (0, -1)
+        assert _prev_reveal_or_slide(0, 0, incremental=True) == (0, 0)
@@ -2,8 +2,7 @@
 
 from __future__ import annotations
 
-import tempfile
-from pathlib import Path
+from typing import TYPE_CHECKING
 
 import pytest
 
@@ -11,6 +10,7 @@ from prezo.parser import (
     Presentation,
     PresentationConfig,
     Slide,
+    _parse_slide,
     clean_marp_directives,
     extract_images,
     extract_notes,
@@ -20,6 +20,9 @@ from prezo.parser import (
     split_slides,
 )
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 
 class TestSlide:
     """Tests for the Slide dataclass."""
@@ -157,95 +160,109 @@ class TestCleanMarpDirectives:
 class TestParsePresentation:
     """Tests for parse_presentation function."""
 
-    def test_parse_from_string(self, sample_presentation_md):
-        pres = parse_presentation(sample_presentation_md)
+    def test_parse_from_string(self, presentation_md):
+        pres = parse_presentation(presentation_md)
         assert pres.title == "Test Presentation"
         assert pres.theme == "default"
         assert pres.total_slides == 3
         assert pres.source_path is None
 
-    def test_parse_from_file(self, sample_presentation_md):
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write(sample_presentation_md)
-            f.flush()
-            path = Path(f.name)
-
-        try:
-            pres = parse_presentation(path)
-            assert pres.title == "Test Presentation"
-            assert pres.source_path == path
-        finally:
-            path.unlink()
-
-    def test_parse_marp_header_as_title(self, marp_presentation_md):
-        pres = parse_presentation(marp_presentation_md)
+    def test_parse_from_file(self, presentation_md, tmp_path: Path):
+        path = tmp_path / "presentation.md"
+        path.write_text(presentation_md)
+
+        pres = parse_presentation(path)
+        assert pres.title == "Test Presentation"
+        assert pres.source_path == path
+
+    @pytest.mark.parametrize("presentation_md", ["marp"], indirect=True)
+    def test_parse_marp_header_as_title(self, presentation_md):
+        pres = parse_presentation(presentation_md)
         assert pres.title == "MARP Header Title"
 
-    def test_parse_cleans_marp_directives(self, marp_presentation_md):
-        pres = parse_presentation(marp_presentation_md)
+    @pytest.mark.parametrize("presentation_md", ["marp"], indirect=True)
+    def test_parse_cleans_marp_directives(self, presentation_md):
+        pres = parse_presentation(presentation_md)
         first_slide = pres.slides[0].content
         assert "<!-- _class" not in first_slide
         assert "![bg" not in first_slide
 
-    def test_parse_extracts_notes(self, sample_presentation_md):
-        pres = parse_presentation(sample_presentation_md)
+    def test_parse_extracts_notes(self, presentation_md):
+        pres = parse_presentation(presentation_md)
         third_slide = pres.slides[2]
         assert "presenter notes" in third_slide.notes
 
-    def test_parse_preserves_raw_content(self, sample_presentation_md):
-        pres = parse_presentation(sample_presentation_md)
+    def test_parse_preserves_raw_content(self, presentation_md):
+        pres = parse_presentation(presentation_md)
         for slide in pres.slides:
             assert slide.raw_content != ""
 
-    def test_parse_simple_no_frontmatter(self, simple_presentation_md):
-        pres = parse_presentation(simple_presentation_md)
+    @pytest.mark.parametrize("presentation_md", ["simple"], indirect=True)
+    def test_parse_simple_no_frontmatter(self, presentation_md):
+        pres = parse_presentation(presentation_md)
         assert pres.title == ""
         assert pres.total_slides == 1
         assert "# Only Slide" in pres.slides[0].content
 
+    def test_reparse_returns_independent_slides(self):
+        source = "# One\n\n![bg left](a.png)\n\n---\n\n# Two"
+        first = parse_presentation(source)
+        first.slides[0].content = "changed"
+        first.slides[0].images[0].layout = "fit"
+        first.slides[0].images[0].width = 10
+
+        second = parse_presentation(source)
+        assert second.slides[0] is not first.slides[0]
+        assert second.slides[0].content == "# One"
+        image = second.slides[0].images[0]
+        assert image is not first.slides[0].images[0]
+        assert (image.layout, image.width) == ("left", None)
+
+        first.slides[0].images.clear()
+        assert len(parse_presentation(source).slides[0].images) == 1
+
+    def test_reparse_reuses_unchanged_slide_results(self):
+        _parse_slide.cache_clear()
+        parse_presentation("# One\n\n---\n\n# Two")
+        parse_presentation("# One\n\n---\n\n# Two edited")
+
+        info = _parse_slide.cache_info()
+        assert info.hits == 1  # "# One" parsed once
+        assert info.misses == 3
+
 
 class TestPresentationUpdateSlide:
     """Tests for Presentation.update_slide method."""
 
-    def test_update_slide_no_source(self, sample_presentation_md):
-        pres = parse_presentation(sample_presentation_md)
+    def test_update_slide_no_source(self, presentation_md):
+        pres = parse_presentation(presentation_md)
         # source_path is None when parsed from string
         with pytest.raises(ValueError, match="no source file path"):
             pres.update_slide(0, "New content")
 
-    def test_update_slide_invalid_index(self, sample_presentation_md):
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write(sample_presentation_md)
-            f.flush()
-            path = Path(f.name)
-
-        try:
-            pres = parse_presentation(path)
-            with pytest.raises(ValueError, match="Invalid slide index"):
-                pres.update_slide(99, "New content")
-        finally:
-            path.unlink()
-
-    def test_update_slide_saves_to_file(self, sample_presentation_md):
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write(sample_presentation_md)
-            f.flush()
-            path = Path(f.name)
-
-        try:
-            pres = parse_presentation(path)
-            pres.update_slide(0, "# Updated First Slide\n\nNew content here.")
-
-            # Read back the file
-            new_content = path.read_text()
-            assert "# Updated First Slide" in new_content
-            assert "New content here." in new_content
-
-            # Re-parse and verify
-            pres2 = parse_presentation(path)
-            assert "Updated First Slide" in pres2.slides[0].content
-        finally:
-            path.unlink()
+    def test_update_slide_invalid_index(self, presentation_md, tmp_path: Path):
+        path = tmp_path / "presentation.md"
+        path.write_text(presentation_md)
+
+        pres = parse_presentation(path)
+        with pytest.raises(ValueError, match="Invalid slide index"):
+            pres.update_slide(99, "New content")
+
+    def test_update_slide_saves_to_file(self, presentation_md, tmp_path: Path):
+        path = tmp_path / "presentation.md"
+        path.write_text(presentation_md)
+
+        pres = parse_presentation(path)
+        pres.update_slide(0, "# Updated First Slide\n\nNew content here.")
+
+        # Read back the file
+        new_content = path.read_text()
+        assert "# Updated First Slide" in new_content
+        assert "New content here." in new_content
+
+        # Re-parse and verify
+        pres2 = parse_presentation(path)
+        assert "Updated First Slide" in pres2.slides[0].content
 
 
 class TestPresentationConfig:
@@ -2,7 +2,17 @@
 
 from __future__ import annotations
 
-from prezo.themes import THEME_ORDER, THEMES, get_next_theme, get_theme
+from dataclasses import FrozenInstanceError, replace
+
+import pytest
+
+from prezo.themes import (
+    THEME_ORDER,
+    THEMES,
+    _check_colors,
+    get_next_theme,
+    get_theme,
+)
 
 
 class TestGetTheme:
@@ -40,6 +50,15 @@ class TestGetNextTheme:
     def test_unknown_theme_returns_first(self):
         assert get_next_theme("nonexistent") == THEME_ORDER[0]
 
+    def test_cycle_visits_every_theme_in_order(self):
+        name = THEME_ORDER[0]
+        visited = []
+        for _ in THEME_ORDER:
+            visited.append(name)
+            name = get_next_theme(name)
+        assert visited == list(THEME_ORDER)
+        assert name == THEME_ORDER[0]
+
 
 class TestThemeProperties:
     """Tests for theme data structure."""
@@ -52,6 +71,14 @@ class TestThemeProperties:
             assert theme.text, f"{name} missing text"
 
     def test_theme_colors_are_hex(self):
-        for name, theme in THEMES.items():
-            assert theme.primary.startswith("#"), f"{name} primary not hex"
-            assert theme.background.startswith("#"), f"{name} background not hex"
+        for theme in THEMES.values():
+            _check_colors(theme)
+
+    def test_check_colors_rejects_non_hex(self):
+        theme = replace(THEMES["dark"], surface="grey")
+        with pytest.raises(ValueError, match=r"dark\.surface"):
+            _check_colors(theme)
+
+    def test_themes_are_immutable(self):
+        with pytest.raises(FrozenInstanceError):
+            THEMES["dark"].primary = "#000000"  # type: ignore[misc]
@@ -2,34 +2,63 @@
 
 from __future__ import annotations
 
-from unittest.mock import patch
+import shutil
+import subprocess
 
 import pytest
 
+from prezo.images import chafa
 from prezo.images.chafa import ChafaRenderer, chafa_available, render_with_chafa
 
+CHAFA_PATH = "/usr/bin/chafa"
+
+# Whether the real chafa binary is installed, checked once at import
+_CHAFA_PRESENT = chafa_available()
+
+# Image file name too long for any placeholder box
+_LONG_NAME = "a" * 100 + ".png"
+
+
+@pytest.fixture
+def fake_chafa(monkeypatch):
+    """Pretend chafa is installed and record the commands it is run with.
+
+    Returns the list of argument vectors passed to ``subprocess.run``. Each
+    run succeeds with empty output; tests needing another outcome patch
+    ``subprocess.run`` again.
+    """
+    calls: list[list[str]] = []
+
+    def fake_run(args, **_kwargs):
+        calls.append(args)
+        return subprocess.CompletedProcess(args, 0, stdout="")
+
+    monkeypatch.setattr(shutil, "which", lambda _name: CHAFA_PATH)
+    monkeypatch.setattr(subprocess, "run", fake_run)
+    return calls
+
 
 class TestChafaAvailable:
     """Tests for chafa_available function."""
 
-    @patch("shutil.which")
-    def test_returns_true_when_chafa_exists(self, mock_which):
-        mock_which.return_value = "/usr/bin/chafa"
+    def test_returns_true_when_chafa_exists(self, monkeypatch):
+        looked_up = []
+        monkeypatch.setattr(
+            shutil, "which", lambda name: looked_up.append(name) or CHAFA_PATH
+        )
         assert chafa_available() is True
-        mock_which.assert_called_with("chafa")
+        assert looked_up == ["chafa"]
 
-    @patch("shutil.which")
-    def test_returns_false_when_chafa_missing(self, mock_which):
-        mock_which.return_value = None
+    def test_returns_false_when_chafa_missing(self, monkeypatch):
+        monkeypatch.setattr(shutil, "which", lambda _name: None)
         assert chafa_available() is False
 
 
 class TestRenderWithChafa:
     """Tests for render_with_chafa function."""
 
-    @patch("prezo.images.chafa.chafa_available")
-    def test_returns_none_when_chafa_unavailable(self, mock_available, tmp_path):
-        mock_available.return_value = False
+    def test_returns_none_when_chafa_unavailable(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(chafa, "chafa_available", lambda: False)
         path = tmp_path / "test.png"
         path.write_bytes(b"fake")
         result = render_with_chafa(path, 40, 20)
@@ -40,52 +69,33 @@ class TestRenderWithChafa:
         result = render_with_chafa(fake_path, 40, 20)
         assert result is None
 
-    @pytest.fixture
-    def real_image(self, tmp_path):
-        """Create a real test image."""
-        try:
-            from PIL import Image
-
-            img = Image.new("RGB", (100, 100), color="red")
-            path = tmp_path / "test.png"
-            img.save(path)
-            return path
-        except ImportError:
-            pytest.skip("PIL not available")
-
-    @pytest.mark.skipif(not chafa_available(), reason="chafa not installed")
-    def test_renders_real_image_when_chafa_available(self, real_image):
-        result = render_with_chafa(real_image, 40, 20)
+    @pytest.mark.skipif(not _CHAFA_PRESENT, reason="chafa not installed")
+    def test_renders_sample_image_when_chafa_available(self, sample_image):
+        result = render_with_chafa(sample_image, 40, 20)
         assert result is not None
         assert len(result) > 0
 
-    @patch("subprocess.run")
-    @patch("prezo.images.chafa.chafa_available")
-    def test_calls_chafa_with_correct_args(self, mock_available, mock_run, tmp_path):
-        mock_available.return_value = True
-        mock_run.return_value.returncode = 0
-        mock_run.return_value.stdout = "rendered output"
-
+    def test_calls_chafa_with_correct_args(self, fake_chafa, tmp_path):
         path = tmp_path / "test.png"
         path.write_bytes(b"fake image data")
 
         render_with_chafa(path, 40, 20)
 
         # Verify chafa was called with expected arguments
-        mock_run.assert_called_once()
-        call_args = mock_run.call_args[0][0]
-        # First arg is the chafa executable (could be full path or just "chafa")
-        assert call_args[0].endswith("chafa")
+        assert len(fake_chafa) == 1
+        call_args = fake_chafa[0]
+        assert call_args[0] == CHAFA_PATH
         assert "--size" in call_args
         assert "40x20" in call_args
         assert "--format" in call_args
         assert "symbols" in call_args
 
-    @patch("subprocess.run")
-    @patch("prezo.images.chafa.chafa_available")
-    def test_returns_none_on_chafa_error(self, mock_available, mock_run, tmp_path):
-        mock_available.return_value = True
-        mock_run.return_value.returncode = 1
+    def test_returns_none_on_chafa_error(self, fake_chafa, monkeypatch, tmp_path):
+        monkeypatch.setattr(
+            subprocess,
+            "run",
+            lambda args, **_kwargs: subprocess.CompletedProcess(args, 1),
+        )
 
         path = tmp_path / "test.png"
         path.write_bytes(b"fake")
@@ -93,13 +103,11 @@ class TestRenderWithChafa:
         result = render_with_chafa(path, 40, 20)
         assert result is None
 
-    @patch("subprocess.run")
-    @patch("prezo.images.chafa.chafa_available")
-    def test_handles_timeout_exception(self, mock_available, mock_run, tmp_path):
-        import subprocess
+    def test_handles_timeout_exception(self, fake_chafa, monkeypatch, tmp_path):
+        def timeout(*_args, **_kwargs):
+            raise subprocess.TimeoutExpired(cmd="chafa", timeout=10)
 
-        mock_available.return_value = True
-        mock_run.side_effect = subprocess.TimeoutExpired(cmd="chafa", timeout=10)
+        monkeypatch.setattr(subprocess, "run", timeout)
 
         path = tmp_path / "test.png"
         path.write_bytes(b"fake")
@@ -119,15 +127,13 @@ class TestChafaRenderer:
         renderer = ChafaRenderer()
         assert renderer.supports_inline() is True
 
-    @patch("prezo.images.chafa.chafa_available")
-    def test_available_property(self, mock_available):
-        mock_available.return_value = True
+    def test_available_property(self, monkeypatch):
+        monkeypatch.setattr(chafa, "chafa_available", lambda: True)
         renderer = ChafaRenderer()
         assert renderer.available is True
 
-    @patch("prezo.images.chafa.chafa_available")
-    def test_not_available_property(self, mock_available):
-        mock_available.return_value = False
+    def test_not_available_property(self, monkeypatch):
+        monkeypatch.setattr(chafa, "chafa_available", lambda: False)
         renderer = ChafaRenderer()
         assert renderer.available is False
 
@@ -141,40 +147,29 @@ class TestChafaRenderer:
 
     def test_placeholder_truncates_long_name(self, tmp_path):
         renderer = ChafaRenderer()
-        long_name = "a" * 100 + ".png"
-        result = renderer._render_placeholder(tmp_path / long_name, 30, 10)
+        result = renderer._render_placeholder(tmp_path / _LONG_NAME, 30, 10)
 
         assert "..." in result
 
-    @pytest.fixture
-    def test_image(self, tmp_path):
-        """Create a test image."""
-        try:
-            from PIL import Image
-
-            img = Image.new("RGB", (50, 50), color="green")
-            path = tmp_path / "chafa_test.png"
-            img.save(path)
-            return path
-        except ImportError:
-            pytest.skip("PIL not available")
-
-    @patch("prezo.images.chafa.render_with_chafa")
-    def test_render_uses_chafa_when_available(self, mock_render, test_image):
-        mock_render.return_value = "chafa output"
+    def test_render_uses_chafa_when_available(self, monkeypatch, sample_image):
+        calls = []
+        monkeypatch.setattr(
+            chafa,
+            "render_with_chafa",
+            lambda *args: calls.append(args) or "chafa output",
+        )
         renderer = ChafaRenderer()
 
-        result = renderer.render(test_image, 40, 20)
+        result = renderer.render(sample_image, 40, 20)
 
         assert result == "chafa output"
-        mock_render.assert_called_once_with(test_image, 40, 20)
+        assert calls == [(sample_image, 40, 20)]
 
-    @patch("prezo.images.chafa.render_with_chafa")
-    def test_render_falls_back_to_placeholder(self, mock_render, test_image):
-        mock_render.return_value = None
+    def test_render_falls_back_to_placeholder(self, monkeypatch, sample_image):
+        monkeypatch.setattr(chafa, "render_with_chafa", lambda *_args: None)
         renderer = ChafaRenderer()
 
-        result = renderer.render(test_image, 40, 20)
+        result = renderer.render(sample_image, 40, 20)
 
         # Should show placeholder
         assert "┌" in result
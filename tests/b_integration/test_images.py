@@ -107,15 +107,11 @@ class TestProcessSlideWithRealImage:
     @pytest.fixture
     def simple_image(self, tmp_path):
         """Create a simple test image."""
-        try:
-            from PIL import Image
-
-            img = Image.new("RGB", (100, 100), color="red")
-            path = tmp_path / "test.png"
-            img.save(path)
-            return path
-        except ImportError:
-            pytest.skip("PIL not available")
+        pil_image = pytest.importorskip("PIL.Image", reason="PIL not available")
+        img = pil_image.new("RGB", (100, 100), color="red")
+        path = tmp_path / "test.png"
+        img.save(path)
+        return path
 
     def test_renders_existing_image(self, tmp_path, simple_image):
         pres_path = tmp_path / "slides.md"
@@ -6,7 +6,6 @@ import pytest
 from textual.app import App, ComposeResult
 from textual.widgets import Static
 
-from prezo.parser import parse_presentation
 from prezo.screens import (
     BlackoutScreen,
     GotoSlideScreen,
@@ -16,6 +15,28 @@ from prezo.screens import (
     TableOfContentsScreen,
 )
 
+# Slide contents for the overview, search and TOC screens. The presentations
+# are built directly (the parser has its own tests) and shared per module:
+# screens only read them.
+_OVERVIEW_SLIDES = (
+    "# Slide 1\n\nContent 1",
+    "# Slide 2\n\nContent 2",
+    "# Slide 3\n\nContent 3",
+)
+
+_SEARCH_SLIDES = (
+    "# Introduction\n\nWelcome to the presentation.",
+    "# Python Basics\n\nLearn about Python programming.",
+    "# Advanced Topics\n\nMore complex subjects here.",
+)
+
+_TOC_SLIDES = (
+    "# Chapter 1\n\nIntroduction content.",
+    "## Section 1.1\n\nDetails here.",
+    "# Chapter 2\n\nMore content.",
+    "### Subsection 2.1.1\n\nDeep content.",
+)
+
 
 class ScreenTestApp(App):
     """Minimal app for testing screens."""
@@ -24,6 +45,24 @@ class ScreenTestApp(App):
         yield Static("Test App")
 
 
+@pytest.fixture(scope="module")
+def overview_presentation(make_presentation):
+    """A three-slide presentation for the overview screen."""
+    return make_presentation(*_OVERVIEW_SLIDES)
+
+
+@pytest.fixture(scope="module")
+def search_presentation(make_presentation):
+    """A presentation with searchable slide content."""
+    return make_presentation(*_SEARCH_SLIDES)
+
+
+@pytest.fixture(scope="module")
+def toc_presentation(make_presentation):
+    """A presentation with nested headings for the TOC."""
+    return make_presentation(*_TOC_SLIDES)
+
+
 # =============================================================================
 # BlackoutScreen Tests
 # =============================================================================
@@ -43,69 +82,31 @@ class TestBlackoutScreen:
     async def test_blackout_screen_mounts(self):
         """Test blackout screen mounts correctly."""
         app = ScreenTestApp()
-        async with app.run_test() as pilot:
-            app.push_screen(BlackoutScreen())
-            await pilot.pause()
+        async with app.run_test():
+            await app.push_screen(BlackoutScreen())
 
             # Screen should be mounted
             assert len(app.screen_stack) == 2
 
-    async def test_blackout_dismisses_on_escape(self):
-        """Test escape key dismisses blackout."""
-        app = ScreenTestApp()
-        async with app.run_test() as pilot:
-            app.push_screen(BlackoutScreen())
-            await pilot.pause()
-
-            await pilot.press("escape")
-            await pilot.pause()
-
-            # Should be back to main screen
-            assert len(app.screen_stack) == 1
-
-    async def test_blackout_dismisses_on_b(self):
-        """Test 'b' key dismisses blackout."""
-        app = ScreenTestApp()
-        async with app.run_test() as pilot:
-            app.push_screen(BlackoutScreen())
-            await pilot.pause()
-
-            await pilot.press("b")
-            await pilot.pause()
-
-            assert len(app.screen_stack) == 1
-
-    async def test_blackout_dismisses_on_space(self):
-        """Test space key dismisses blackout."""
+    async def test_blackout_dismisses_on_keys(self):
+        """Test escape, 'b', space and enter each dismiss blackout."""
         app = ScreenTestApp()
         async with app.run_test() as pilot:
-            app.push_screen(BlackoutScreen())
-            await pilot.pause()
+            for key in ("escape", "b", "space", "enter"):
+                await app.push_screen(BlackoutScreen())
+                assert len(app.screen_stack) == 2, key
 
-            await pilot.press("space")
-            await pilot.pause()
+                await pilot.press(key)
 
-            assert len(app.screen_stack) == 1
-
-    async def test_blackout_dismisses_on_enter(self):
-        """Test enter key dismisses blackout."""
-        app = ScreenTestApp()
-        async with app.run_test() as pilot:
-            app.push_screen(BlackoutScreen())
-            await pilot.pause()
-
-            await pilot.press("enter")
-            await pilot.pause()
-
-            assert len(app.screen_stack) == 1
+                # Should be back to main screen
+                assert len(app.screen_stack) == 1, key
 
     async def test_whiteout_has_white_background(self):
         """Test white screen has white background."""
         app = ScreenTestApp()
-        async with app.run_test() as pilot:
+        async with app.run_test():
             screen = BlackoutScreen(white=True)
-            app.push_screen(screen)
-            await pilot.pause()
+            await app.push_screen(screen)
 
             # Screen should be mounted with white setting
             assert screen.white is True
@@ -126,69 +127,49 @@ class TestGotoSlideScreen:
     async def test_goto_screen_mounts(self):
         """Test goto screen mounts correctly."""
         app = ScreenTestApp()
-        async with app.run_test() as pilot:
-            app.push_screen(GotoSlideScreen(total_slides=10))
-            await pilot.pause()
+        async with app.run_test():
+            await app.push_screen(GotoSlideScreen(total_slides=10))
 
             assert len(app.screen_stack) == 2
 
     async def test_goto_dismisses_on_escape(self):
         """Test escape cancels goto dialog."""
         app = ScreenTestApp()
-        result = None
-
-        def handle_result(r):
-            nonlocal result
-            result = r
+        results = []
 
         async with app.run_test() as pilot:
-            app.push_screen(GotoSlideScreen(total_slides=10), handle_result)
-            await pilot.pause()
+            await app.push_screen(GotoSlideScreen(total_slides=10), results.append)
 
             await pilot.press("escape")
-            await pilot.pause()
 
             assert len(app.screen_stack) == 1
-            assert result is None
+            assert results == [None]
 
     async def test_goto_returns_slide_index(self):
         """Test valid input returns correct slide index."""
         app = ScreenTestApp()
-        result = None
-
-        def handle_result(r):
-            nonlocal result
-            result = r
+        results = []
 
         async with app.run_test() as pilot:
-            app.push_screen(GotoSlideScreen(total_slides=10), handle_result)
-            await pilot.pause()
+            await app.push_screen(GotoSlideScreen(total_slides=10), results.append)
 
             # Type slide number (user enters 1-indexed)
-            await pilot.press("5")
-            await pilot.press("enter")
-            await pilot.pause()
+            await pilot.press("5", "enter")
 
             # Should return 0-indexed value
-            assert result == 4
+            assert results == [4]
 
     async def test_goto_empty_input_dismisses(self):
         """Test empty input dismisses without result."""
         app = ScreenTestApp()
-        result = "not_set"
-
-        def handle_result(r):
-            nonlocal result
-            result = r
+        results = []
 
         async with app.run_test() as pilot:
-            app.push_screen(GotoSlideScreen(total_slides=10), handle_result)
-            await pilot.pause()
+            await app.push_screen(GotoSlideScreen(total_slides=10), results.append)
 
             await pilot.press("enter")  # Submit empty
-            await pilot.pause()
 
-            assert result is None
+            assert results == [None]
 
 
 # =============================================================================
@@ -202,35 +183,22 @@ class TestHelpScreen:
     async def test_help_screen_mounts(self):
         """Test help screen mounts correctly."""
         app = ScreenTestApp()
-        async with app.run_test() as pilot:
-            app.push_screen(HelpScreen())
-            await pilot.pause()
+        async with app.run_test():
+            await app.push_screen(HelpScreen())
 
             assert len(app.screen_stack) == 2
 
-    async def test_help_dismisses_on_escape(self):
-        """Test escape dismisses help."""
+    async def test_help_dismisses_on_keys(self):
+        """Test escape and '?' each dismiss help."""
         app = ScreenTestApp()
         async with app.run_test() as pilot:
-            app.push_screen(HelpScreen())
-            await pilot.pause()
+            for key in ("escape", "question_mark"):
+                await app.push_screen(HelpScreen())
+                assert len(app.screen_stack) == 2, key
 
-            await pilot.press("escape")
-            await pilot.pause()
+                await pilot.press(key)
 
-            assert len(app.screen_stack) == 1
-
-    async def test_help_dismisses_on_question_mark(self):
-        """Test '?' dismisses help."""
-        app = ScreenTestApp()
-        async with app.run_test() as pilot:
-            app.push_screen(HelpScreen())
-            await pilot.pause()
-
-            await pilot.press("question_mark")
-            await pilot.pause()
-
-            assert len(app.screen_stack) == 1
+                assert len(app.screen_stack) == 1, key
 
 
 # =============================================================================
@@ -241,62 +209,19 @@ class TestHelpScreen:
 class TestSlideOverviewScreen:
     """Tests for SlideOverviewScreen."""
 
-    @pytest.fixture
-    def sample_presentation(self):
-        """Create a sample presentation."""
-        return parse_presentation("""---
-title: Test
----
-
-# Slide 1
-
-Content 1
-
----
-
-# Slide 2
-
-Content 2
-
----
-
-# Slide 3
-
-Content 3
-""")
-
-    def test_init_stores_presentation(self, sample_presentation):
-        screen = SlideOverviewScreen(sample_presentation, 0)
-        assert screen.presentation is sample_presentation
+    def test_init_stores_presentation(self, overview_presentation):
+        screen = SlideOverviewScreen(overview_presentation, 0)
+        assert screen.presentation is overview_presentation
         assert screen.current_slide == 0
 
-    async def test_overview_screen_mounts(self, sample_presentation):
+    async def test_overview_screen_mounts(self, overview_presentation):
         """Test overview screen mounts correctly."""
         app = ScreenTestApp()
-        async with app.run_test() as pilot:
-            app.push_screen(SlideOverviewScreen(sample_presentation, 0))
-            await pilot.pause()
+        async with app.run_test():
+            await app.push_screen(SlideOverviewScreen(overview_presentation, 0))
 
             assert len(app.screen_stack) == 2
 
-    async def test_overview_dismisses_on_escape(self, sample_presentation):
-        """Test escape dismisses overview."""
-        app = ScreenTestApp()
-        result = "not_set"
-
-        def handle_result(r):
-            nonlocal result
-            result = r
-
-        async with app.run_test() as pilot:
-            app.push_screen(SlideOverviewScreen(sample_presentation, 0), handle_result)
-            await pilot.pause()
-
-            await pilot.press("escape")
-            await pilot.pause()
-
-            assert result is None
-
 
 # =============================================================================
 # SlideSearchScreen Tests
@@ -306,61 +231,18 @@ Content 3
 class TestSlideSearchScreen:
     """Tests for SlideSearchScreen."""
 
-    @pytest.fixture
-    def sample_presentation(self):
-        """Create a sample presentation for search tests."""
-        return parse_presentation("""---
-title: Test
----
+    def test_init_stores_presentation(self, search_presentation):
+        screen = SlideSearchScreen(search_presentation)
+        assert screen.presentation is search_presentation
 
-# Introduction
-
-Welcome to the presentation.
-
----
-
-# Python Basics
-
-Learn about Python programming.
-
----
-
-# Advanced Topics
-
-More complex subjects here.
-""")
-
-    def test_init_stores_presentation(self, sample_presentation):
-        screen = SlideSearchScreen(sample_presentation)
-        assert screen.presentation is sample_presentation
-
-    async def test_search_screen_mounts(self, sample_presentation):
+    async def test_search_screen_mounts(self, search_presentation):
         """Test search screen mounts correctly."""
         app = ScreenTestApp()
-        async with app.run_test() as pilot:
-            app.push_screen(SlideSearchScreen(sample_presentation))
-            await pilot.pause()
+        async with app.run_test():
+            await app.push_screen(SlideSearchScreen(search_presentation))
 
             assert len(app.screen_stack) == 2
 
-    async def test_search_dismisses_on_escape(self, sample_presentation):
-        """Test escape dismisses search."""
-        app = ScreenTestApp()
-        result = "not_set"
-
-        def handle_result(r):
-            nonlocal result
-            result = r
-
-        async with app.run_test() as pilot:
-            app.push_screen(SlideSearchScreen(sample_presentation), handle_result)
-            await pilot.pause()
-
-            await pilot.press("escape")
-            await pilot.pause()
-
-            assert result is None
-
 
 # =============================================================================
 # TableOfContentsScreen Tests
@@ -370,78 +252,47 @@ More complex subjects here.
 class TestTableOfContentsScreen:
     """Tests for TableOfContentsScreen."""
 
-    @pytest.fixture
-    def sample_presentation(self):
-        """Create a presentation with headers for TOC."""
-        return parse_presentation("""---
-title: Test
----
-
-# Chapter 1
-
-Introduction content.
-
----
-
-## Section 1.1
-
-Details here.
-
----
-
-# Chapter 2
-
-More content.
-
----
-
-### Subsection 2.1.1
-
-Deep content.
-""")
-
-    def test_init_stores_presentation(self, sample_presentation):
-        screen = TableOfContentsScreen(sample_presentation, 0)
-        assert screen.presentation is sample_presentation
+    def test_init_stores_presentation(self, toc_presentation):
+        screen = TableOfContentsScreen(toc_presentation, 0)
+        assert screen.presentation is toc_presentation
         assert screen.current_slide == 0
 
-    async def test_toc_screen_mounts(self, sample_presentation):
+    async def test_toc_screen_mounts(self, toc_presentation):
         """Test TOC screen mounts correctly."""
         app = ScreenTestApp()
-        async with app.run_test() as pilot:
-            app.push_screen(TableOfContentsScreen(sample_presentation, 0))
-            await pilot.pause()
+        async with app.run_test():
+            await app.push_screen(TableOfContentsScreen(toc_presentation, 0))
 
             assert len(app.screen_stack) == 2
 
-    async def test_toc_dismisses_on_escape(self, sample_presentation):
-        """Test escape dismisses TOC."""
-        app = ScreenTestApp()
-        result = "not_set"
-
-        def handle_result(r):
-            nonlocal result
-            result = r
 
-        async with app.run_test() as pilot:
-            app.push_screen(
-                TableOfContentsScreen(sample_presentation, 0), handle_result
-            )
-            await pilot.pause()
-
-            await pilot.press("escape")
-            await pilot.pause()
+# =============================================================================
+# Presentation Screen Dismissal Tests
+# =============================================================================
 
-            assert result is None
 
-    async def test_toc_dismisses_on_q(self, sample_presentation):
-        """Test 'q' key dismisses TOC."""
+class TestPresentationScreenDismissal:
+    """Tests shared by the overview, search and TOC screens."""
+
+    async def test_cancel_keys_dismiss_without_result(
+        self, overview_presentation, search_presentation, toc_presentation
+    ):
+        """Test each cancel key dismisses its screen with no selection."""
+        cases = [
+            (SlideOverviewScreen(overview_presentation, 0), "escape"),
+            (SlideOverviewScreen(overview_presentation, 0), "q"),
+            (SlideSearchScreen(search_presentation), "escape"),
+            (TableOfContentsScreen(toc_presentation, 0), "escape"),
+            (TableOfContentsScreen(toc_presentation, 0), "q"),
+        ]
         app = ScreenTestApp()
         async with app.run_test() as pilot:
-            app.push_screen(TableOfContentsScreen(sample_presentation, 0))
-            await pilot.pause()
+            for screen, key in cases:
+                results = []
+                await app.push_screen(screen, results.append)
 
-            await pilot.press("q")
-            await pilot.pause()
+                await pilot.press(key)
 
-            assert len(app.screen_stack) == 1
+                case = f"{type(screen).__name__}/{key}"
+                assert len(app.screen_stack) == 1, case
+                assert results == [None], case
@@ -2,111 +2,174 @@
 
 from __future__ import annotations
 
+import pytest
+
 from prezo.widgets import SlideButton
 from prezo.widgets.slide_button import extract_slide_title
 
+# -----------------------------------------------------------------------------
+# extract_slide_title function
+# -----------------------------------------------------------------------------
+
+
+def test_extracts_h1():
+    content = "# First Slide\n\nSome content"
+    title = extract_slide_title(content, 0)
+    assert title == "First Slide"
+
+
+def test_extracts_h2():
+    content = "## Second Level Heading\n\nContent"
+    title = extract_slide_title(content, 0)
+    assert title == "Second Level Heading"
+
+
+def test_extracts_h3():
+    content = "### Third Level\n\nContent"
+    title = extract_slide_title(content, 0)
+    assert title == "Third Level"
+
+
+def test_extracts_h6():
+    content = "###### Smallest Heading\n\nContent"
+    title = extract_slide_title(content, 0)
+    assert title == "Smallest Heading"
+
+
+def test_removes_bold_markers():
+    content = "# **Bold Title**\n\nContent"
+    title = extract_slide_title(content, 0)
+    assert title == "Bold Title"
+    assert "**" not in title
+
+
+def test_removes_italic_markers():
+    content = "# *Italic Title*\n\nContent"
+    title = extract_slide_title(content, 0)
+    assert title == "Italic Title"
+    assert "*" not in title
+
+
+def test_truncates_long_titles():
+    content = (
+        "# This is a very long title that should be truncated "
+        "because it exceeds the maximum length\n\nContent"
+    )
+    title = extract_slide_title(content, 0)
+    assert len(title) <= 35
+    assert title.endswith("...")
+
+
+def test_truncates_long_emphasized_title():
+    content = "# **Bold** " + "word " * 1000 + "\n\nContent"
+    title = extract_slide_title(content, 0)
+    assert title.startswith("Bold word")
+    assert len(title) <= 35
+    assert title.endswith("...")
+
+
+@pytest.mark.parametrize("marker", ["*", "**"])
+def test_truncates_emphasis_crossing_scan_window(marker):
+    heading = "Emphasized heading words " * 5
+    content = f"# {marker}{heading.strip()}{marker}\n\nContent"
+    title = extract_slide_title(content, 0)
+    assert "*" not in title
+    assert title.startswith("Emphasized heading words")
+    assert title.endswith("...")
+
+
+@pytest.mark.parametrize(
+    ("heading", "expected"),
+    [
+        ("**a** " * 100, "a " * 16 + "..."),
+        ("*x*" * 40 + "tail", "x" * 32 + "..."),
+    ],
+)
+def test_truncates_heading_dense_with_emphasis(heading, expected):
+    title = extract_slide_title(f"# {heading}\n\nContent", 0)
+    assert title == expected
+
+
+def test_fallback_to_first_line():
+    content = "No heading here\n\nJust plain text"
+    title = extract_slide_title(content, 0)
+    assert title == "No heading here"
+
+
+def test_fallback_truncates_long_line():
+    content = (
+        "This is a very long first line without any heading "
+        "that should be truncated\n\nMore content"
+    )
+    title = extract_slide_title(content, 0)
+    assert len(title) <= 35
+    assert title.endswith("...")
+
+
+def test_fallback_to_slide_number():
+    content = ""
+    title = extract_slide_title(content, 0)
+    assert title == "Slide 1"
+
+    title = extract_slide_title(content, 4)
+    assert title == "Slide 5"
+
+
+def test_skips_html_comments():
+    content = "<!-- comment -->\n# Real Title\n\nContent"
+    title = extract_slide_title(content, 0)
+    assert title == "Real Title"
+
+
+def test_skips_empty_lines():
+    content = "\n\n# Title After Blanks\n\nContent"
+    title = extract_slide_title(content, 0)
+    assert title == "Title After Blanks"
+
+
+def test_whitespace_only_content():
+    content = "   \n  \n   "
+    title = extract_slide_title(content, 2)
+    assert title == "Slide 3"
+
+
+def test_heading_with_extra_whitespace():
+    content = "#   Spaced   Title   \n\nContent"
+    title = extract_slide_title(content, 0)
+    assert "Spaced" in title
+
+
+# -----------------------------------------------------------------------------
+# SlideButton widget creation
+# -----------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="module")
+def sixth_slide_button() -> SlideButton:
+    """A button for the sixth slide (index 5), shared by read-only tests."""
+    return SlideButton(5, "# Test")
+
+
+@pytest.fixture(scope="module")
+def current_button() -> SlideButton:
+    """A button for the currently active slide."""
+    return SlideButton(0, "# Test", is_current=True)
+
+
+@pytest.fixture(scope="module")
+def other_button() -> SlideButton:
+    """A button for a slide that is not the active one."""
+    return SlideButton(1, "# Test", is_current=False)
+
+
+def test_button_has_correct_id(sixth_slide_button):
+    assert sixth_slide_button.id == "slide-5"
+
+
+def test_button_stores_slide_index(sixth_slide_button):
+    assert sixth_slide_button.slide_index == 5
+
 
-class TestExtractSlideTitle:
-    """Tests for extract_slide_title function."""
-
-    def test_extracts_h1(self):
-        content = "# First Slide\n\nSome content"
-        title = extract_slide_title(content, 0)
-        assert title == "First Slide"
-
-    def test_extracts_h2(self):
-        content = "## Second Level Heading\n\nContent"
-        title = extract_slide_title(content, 0)
-        assert title == "Second Level Heading"
-
-    def test_extracts_h3(self):
-        content = "### Third Level\n\nContent"
-        title = extract_slide_title(content, 0)
-        assert title == "Third Level"
-
-    def test_extracts_h6(self):
-        content = "###### Smallest Heading\n\nContent"
-        title = extract_slide_title(content, 0)
-        assert title == "Smallest Heading"
-
-    def test_removes_bold_markers(self):
-        content = "# **Bold Title**\n\nContent"
-        title = extract_slide_title(content, 0)
-        assert title == "Bold Title"
-        assert "**" not in title
-
-    def test_removes_italic_markers(self):
-        content = "# *Italic Title*\n\nContent"
-        title = extract_slide_title(content, 0)
-        assert title == "Italic Title"
-        assert "*" not in title
-
-    def test_truncates_long_titles(self):
-        content = (
-            "# This is a very long title that should be truncated "
-            "because it exceeds the maximum length\n\nContent"
-        )
-        title = extract_slide_title(content, 0)
-        assert len(title) <= 35
-        assert title.endswith("...")
-
-    def test_fallback_to_first_line(self):
-        content = "No heading here\n\nJust plain text"
-        title = extract_slide_title(content, 0)
-        assert title == "No heading here"
-
-    def test_fallback_truncates_long_line(self):
-        content = (
-            "This is a very long first line without any heading "
-            "that should be truncated\n\nMore content"
-        )
-        title = extract_slide_title(content, 0)
-        assert len(title) <= 35
-        assert title.endswith("...")
-
-    def test_fallback_to_slide_number(self):
-        content = ""
-        title = extract_slide_title(content, 0)
-        assert title == "Slide 1"
-
-        title = extract_slide_title(content, 4)
-        assert title == "Slide 5"
-
-    def test_skips_html_comments(self):
-        content = "<!-- comment -->\n# Real Title\n\nContent"
-        title = extract_slide_title(content, 0)
-        assert title == "Real Title"
-
-    def test_skips_empty_lines(self):
-        content = "\n\n# Title After Blanks\n\nContent"
-        title = extract_slide_title(content, 0)
-        assert title == "Title After Blanks"
-
-    def test_whitespace_only_content(self):
-        content = "   \n  \n   "
-        title = extract_slide_title(content, 2)
-        assert title == "Slide 3"
-
-    def test_heading_with_extra_whitespace(self):
-        content = "#   Spaced   Title   \n\nContent"
-        title = extract_slide_title(content, 0)
-        assert "Spaced" in title
-
-
-class TestSlideButtonCreation:
-    """Tests for SlideButton widget creation."""
-
-    def test_button_has_correct_id(self):
-        button = SlideButton(5, "# Test", is_current=False)
-        assert button.id == "slide-5"
-
-    def test_button_stores_slide_index(self):
-        button = SlideButton(3, "# Test", is_current=False)
-        assert button.slide_index == 3
-
-    def test_button_stores_is_current(self):
-        button = SlideButton(0, "# Test", is_current=True)
-        assert button.is_current is True
-
-        button2 = SlideButton(1, "# Test", is_current=False)
-        assert button2.is_current is False
+def test_button_stores_is_current(current_button, other_button):
+    assert current_button.is_current is True
+    assert other_button.is_current is False
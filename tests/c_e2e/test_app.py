@@ -2,10 +2,72 @@
 
 from __future__ import annotations
 
+import shutil
+
 import pytest
+import pytest_asyncio
 
+from prezo import config as prezo_config
 from prezo.app import PrezoApp, _format_recent_files
-from prezo.config import Config
+from prezo.config import AppState, Config
+from prezo.themes import THEME_ORDER
+
+
+@pytest.fixture(autouse=True)
+def isolated_state(tmp_path, monkeypatch):
+    """Give each test a fresh app state that is saved under tmp_path.
+
+    Keeps tests from touching the user's state file, and keeps last-slide
+    positions from leaking between tests that share a presentation file.
+    """
+    monkeypatch.setattr(prezo_config, "CONFIG_DIR", tmp_path / "config")
+    monkeypatch.setattr(prezo_config, "STATE_FILE", tmp_path / "config" / "state.json")
+    monkeypatch.setattr(prezo_config, "_state", AppState())
+
+
+@pytest.fixture(scope="module")
+def presentation_file(tmp_path_factory, build_pres):
+    """Create a test presentation file (written once per module)."""
+    pres = tmp_path_factory.mktemp("pres") / "test_pres.md"
+    pres.write_text(
+        build_pres(
+            [
+                "# First Slide\n\nContent of first slide.",
+                "# Second Slide\n\nContent of second slide.",
+                "# Third Slide\n\nContent of third slide.",
+            ],
+            {"title": "Test Presentation"},
+        )
+    )
+    return pres
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def empty_app(tmp_path_factory):
+    """Yield one app without a presentation, shared by the whole module.
+
+    Tests using it must run in the module event loop and leave the app on
+    its main screen. The app gets its own isolated state, since module
+    fixtures are set up before the per-test ``isolated_state``.
+    """
+    config_dir = tmp_path_factory.mktemp("config")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(prezo_config, "CONFIG_DIR", config_dir)
+        mp.setattr(prezo_config, "STATE_FILE", config_dir / "state.json")
+        mp.setattr(prezo_config, "_state", AppState())
+        app = PrezoApp()
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            yield app, pilot
+
+
+@pytest_asyncio.fixture
+async def mounted_app(presentation_file):
+    """Yield an app running the shared presentation, once it has loaded."""
+    app = PrezoApp(presentation_file)
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        yield app, pilot
 
 
 class TestFormatRecentFiles:
@@ -95,187 +157,238 @@ class TestPrezoAppInit:
         assert app.config.display.theme == "light"
 
 
-class TestPrezoAppAsync:
-    """Async tests for PrezoApp using Textual's test framework."""
+class TestCommandPalette:
+    """Tests for command palette functionality."""
 
-    @pytest.fixture
-    def presentation_file(self, tmp_path):
-        """Create a test presentation file."""
-        pres = tmp_path / "test_pres.md"
-        pres.write_text("""---
-title: Test Presentation
----
+    def test_command_palette_enabled(self):
+        """Test that command palette is enabled on the app."""
+        assert PrezoApp.ENABLE_COMMAND_PALETTE is True
+        assert PrezoApp.COMMAND_PALETTE_BINDING == "ctrl+p"
 
-# First Slide
+    def test_commands_provider_registered(self):
+        """Test that PrezoCommands provider is registered."""
+        from prezo.app import PrezoCommands
 
-Content of first slide.
+        assert PrezoCommands in PrezoApp.COMMANDS
 
----
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_command_palette_opens(self, empty_app):
+        """Test that command palette can be opened."""
+        app, pilot = empty_app
+        # Try to open command palette
+        await pilot.press("ctrl+p")
+        await pilot.pause()
+        # The app should have focus somewhere (command palette or main)
+        # Just verify no errors occurred
+        assert app.is_running
 
-# Second Slide
+        # Close the palette so the shared app is back on its main screen
+        await pilot.press("escape")
+        await pilot.pause()
+        assert len(app.screen_stack) == 1
 
-Content of second slide.
 
----
+class TestPrezoCommandsProvider:
+    """Tests for PrezoCommands provider."""
 
-# Third Slide
+    def test_commands_provider_search_returns_hits(self):
+        """Test that command search returns results."""
+        from prezo.app import PrezoCommands
 
-Content of third slide.
-""")
-        return pres
+        # Provider needs an app context, so only check its structure here
+        assert hasattr(PrezoCommands, "search")
 
-    async def test_app_mounts_successfully(self):
-        """Test that app mounts without errors."""
-        app = PrezoApp()
-        async with app.run_test():
-            # App should mount and show welcome screen
-            assert app.is_running
+    def test_command_table_actions_exist(self):
+        """Test that every palette command maps to an app action."""
+        from prezo.app import PrezoCommands
 
-    async def test_app_shows_welcome_when_no_presentation(self):
-        """Test welcome message shows when no presentation loaded."""
-        app = PrezoApp()
-        async with app.run_test():
-            # Should show welcome message
-            content = app.query_one("#slide-content")
-            assert content is not None
+        for _name, action, _description in PrezoCommands.COMMAND_TABLE:
+            if action.startswith("set_theme_"):
+                assert action.removeprefix("set_theme_") in THEME_ORDER
+            else:
+                assert hasattr(PrezoApp, f"action_{action}"), action
 
-    async def test_app_loads_presentation(self, presentation_file):
-        """Test that app loads a presentation file."""
-        app = PrezoApp(presentation_file)
-        async with app.run_test() as pilot:
-            # Wait for load
-            await pilot.pause()
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_command_palette_search(self, empty_app):
+        """Test that navigation, theme and file commands can be found."""
+        from prezo.app import PrezoCommands
 
-            assert app.presentation is not None
-            assert app.presentation.total_slides == 3
-            assert app.current_slide == 0
+        app, _pilot = empty_app
+        provider = PrezoCommands(app.screen, None)
 
-    async def test_next_slide_action(self, presentation_file):
-        """Test navigating to next slide."""
-        app = PrezoApp(presentation_file)
+        # Query -> text expected in at least one matching command name
+        expected = {
+            "next": "Next",  # "Next Slide"
+            "theme": "Theme",  # "Cycle Theme", "Theme: Dark", ...
+            "reload": "Reload",  # "Reload Presentation"
+        }
+        for query, name in expected.items():
+            hits = [hit async for hit in provider.search(query)]
+
+            assert len(hits) > 0, query
+            assert any(name in str(h.match_display) for h in hits), query
+
+    async def test_next_slide_command_uses_correct_action(self, tmp_path):
+        """Test that Next Slide command calls the correct action."""
+        from prezo.app import PrezoCommands
+
+        pres = tmp_path / "test.md"
+        pres.write_text("# Slide 1\n\n---\n\n# Slide 2\n\n---\n\n# Slide 3")
+
+        app = PrezoApp(pres)
         async with app.run_test() as pilot:
             await pilot.pause()
 
             assert app.current_slide == 0
 
-            await pilot.press("right")
+            provider = PrezoCommands(app.screen, None)
+
+            # Find the "Next Slide" hit and execute its command callback
+            async for hit in provider.search("next"):
+                if "Next" in str(hit.match_display):
+                    # Hit.command is a coroutine function (partial of async _run_action)
+                    await hit.command()
+                    await pilot.pause()
+                    break
+
+            # Should have advanced to next slide
             assert app.current_slide == 1
 
-            await pilot.press("j")
-            assert app.current_slide == 2
 
-    async def test_prev_slide_action(self, presentation_file):
+class TestPrezoAppAsync:
+    """Async tests for PrezoApp using Textual's test framework."""
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_app_mounts_successfully(self, empty_app):
+        """Test that app mounts without errors."""
+        app, _pilot = empty_app
+        # App should mount and show welcome screen
+        assert app.is_running
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_app_shows_welcome_when_no_presentation(self, empty_app):
+        """Test welcome message shows when no presentation loaded."""
+        app, _pilot = empty_app
+        # Should show welcome message
+        content = app.query_one("#slide-content")
+        assert content is not None
+        # ...built from isolated state, not the user's recent files
+        assert app.state.recent_files == []
+
+    async def test_app_loads_presentation(self, mounted_app):
+        """Test that app loads a presentation file."""
+        app, _pilot = mounted_app
+
+        assert app.presentation.total_slides == 3
+        assert app.current_slide == 0
+
+    async def test_next_slide_action(self, mounted_app):
+        """Test navigating to next slide."""
+        app, pilot = mounted_app
+
+        assert app.current_slide == 0
+
+        await pilot.press("right")
+        assert app.current_slide == 1
+
+        await pilot.press("j")
+        assert app.current_slide == 2
+
+    async def test_prev_slide_action(self, mounted_app):
         """Test navigating to previous slide."""
-        app = PrezoApp(presentation_file)
-        async with app.run_test() as pilot:
-            await pilot.pause()
+        app, pilot = mounted_app
 
-            # Go to last slide first
-            app.current_slide = 2
-            await pilot.pause()
+        # Go to last slide first
+        app.current_slide = 2
 
-            await pilot.press("left")
-            assert app.current_slide == 1
+        await pilot.press("left")
+        assert app.current_slide == 1
 
-            await pilot.press("k")
-            assert app.current_slide == 0
+        await pilot.press("k")
+        assert app.current_slide == 0
 
-    async def test_first_slide_action(self, presentation_file):
+    async def test_first_slide_action(self, mounted_app):
         """Test going to first slide."""
-        app = PrezoApp(presentation_file)
-        async with app.run_test() as pilot:
-            await pilot.pause()
+        app, pilot = mounted_app
 
-            app.current_slide = 2
-            await pilot.pause()
+        app.current_slide = 2
 
-            await pilot.press("home")
-            assert app.current_slide == 0
+        await pilot.press("home")
+        assert app.current_slide == 0
 
-    async def test_last_slide_action(self, presentation_file):
+    async def test_last_slide_action(self, mounted_app):
         """Test going to last slide."""
-        app = PrezoApp(presentation_file)
-        async with app.run_test() as pilot:
-            await pilot.pause()
+        app, pilot = mounted_app
 
-            await pilot.press("end")
-            assert app.current_slide == 2
+        await pilot.press("end")
+        assert app.current_slide == 2
 
-    async def test_g_key_goes_to_first(self, presentation_file):
+    async def test_g_key_goes_to_first(self, mounted_app):
         """Test 'g' key goes to first slide."""
-        app = PrezoApp(presentation_file)
-        async with app.run_test() as pilot:
-            await pilot.pause()
-            app.current_slide = 2
-            await pilot.pause()
+        app, pilot = mounted_app
 
-            await pilot.press("g")
-            assert app.current_slide == 0
+        app.current_slide = 2
+
+        await pilot.press("g")
+        assert app.current_slide == 0
 
-    async def test_G_key_goes_to_last(self, presentation_file):
+    async def test_G_key_goes_to_last(self, mounted_app):
         """Test 'G' key goes to last slide."""
-        app = PrezoApp(presentation_file)
-        async with app.run_test() as pilot:
-            await pilot.pause()
+        app, pilot = mounted_app
 
-            await pilot.press("G")
-            assert app.current_slide == 2
+        await pilot.press("G")
+        assert app.current_slide == 2
 
-    async def test_toggle_notes(self, presentation_file):
+    async def test_toggle_notes(self, mounted_app):
         """Test toggling notes panel."""
-        app = PrezoApp(presentation_file)
-        async with app.run_test() as pilot:
-            await pilot.pause()
+        app, pilot = mounted_app
 
-            assert app.notes_visible is False
+        assert app.notes_visible is False
 
-            await pilot.press("p")
-            assert app.notes_visible is True
+        await pilot.press("p")
+        assert app.notes_visible is True
 
-            await pilot.press("p")
-            assert app.notes_visible is False
+        await pilot.press("p")
+        assert app.notes_visible is False
 
-    async def test_cannot_go_before_first_slide(self, presentation_file):
+    async def test_cannot_go_before_first_slide(self, mounted_app):
         """Test cannot navigate before first slide."""
-        app = PrezoApp(presentation_file)
-        async with app.run_test() as pilot:
-            await pilot.pause()
+        app, pilot = mounted_app
 
-            assert app.current_slide == 0
-            await pilot.press("left")
-            assert app.current_slide == 0  # Should stay at 0
+        assert app.current_slide == 0
+        await pilot.press("left")
+        assert app.current_slide == 0  # Should stay at 0
 
-    async def test_cannot_go_past_last_slide(self, presentation_file):
+    async def test_cannot_go_past_last_slide(self, mounted_app):
         """Test cannot navigate past last slide."""
-        app = PrezoApp(presentation_file)
-        async with app.run_test() as pilot:
-            await pilot.pause()
+        app, pilot = mounted_app
 
-            app.current_slide = 2
-            await pilot.pause()
+        app.current_slide = 2
 
-            await pilot.press("right")
-            assert app.current_slide == 2  # Should stay at last
+        await pilot.press("right")
+        assert app.current_slide == 2  # Should stay at last
 
-    async def test_space_advances_slide(self, presentation_file):
+    async def test_space_advances_slide(self, mounted_app):
         """Test space key advances to next slide."""
-        app = PrezoApp(presentation_file)
-        async with app.run_test() as pilot:
-            await pilot.pause()
+        app, pilot = mounted_app
 
-            await pilot.press("space")
-            assert app.current_slide == 1
+        await pilot.press("space")
+        assert app.current_slide == 1
 
-    async def test_theme_cycling(self, presentation_file):
-        """Test cycling through themes."""
-        app = PrezoApp(presentation_file)
-        async with app.run_test() as pilot:
-            await pilot.pause()
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_cycle_theme_action(self, empty_app):
+        """Test cycling moves to the next theme in order."""
+        app, _pilot = empty_app
+        app.app_theme = "dark"
+        try:
+            app.action_cycle_theme()
+            assert app.app_theme == "light"
 
-            initial_theme = app.app_theme
-            await pilot.press("T")
-            # Theme should have changed
-            assert app.app_theme != initial_theme or initial_theme == "dark"
+            app.action_cycle_theme()
+            assert app.app_theme == "dracula"
+        finally:
+            # Leave the shared app on its default theme, even on failure
+            app.app_theme = "dark"
 
     async def test_quit_action(self):
         """Test quit action exits app."""
@@ -286,39 +399,31 @@ Content of third slide.
             assert not app.is_running or app._exit
 
 
-class TestPrezoAppWithNotes:
-    """Tests for presentations with speaker notes."""
-
-    @pytest.fixture
-    def presentation_with_notes(self, tmp_path):
-        """Create a presentation with speaker notes."""
-        pres = tmp_path / "notes_pres.md"
-        pres.write_text("""---
-title: Notes Test
----
-
-# Slide With Notes
-
-Main content here.
-
-???
-These are speaker notes for slide 1.
-
----
-
-# Slide Without Notes
-
-Just content, no notes.
-
----
-
-# Another With Notes
+@pytest.fixture(scope="module")
+def presentation_with_notes(tmp_path_factory, build_pres):
+    """Create a presentation with speaker notes."""
+    pres = tmp_path_factory.mktemp("notes") / "notes_pres.md"
+    pres.write_text(
+        build_pres(
+            [
+                (
+                    "# Slide With Notes\n\nMain content here.\n\n"
+                    "???\nThese are speaker notes for slide 1."
+                ),
+                "# Slide Without Notes\n\nJust content, no notes.",
+                (
+                    "# Another With Notes\n\nMore content.\n\n"
+                    "<!-- notes: HTML style notes here -->"
+                ),
+            ],
+            {"title": "Notes Test"},
+        )
+    )
+    return pres
 
-More content.
 
-<!-- notes: HTML style notes here -->
-""")
-        return pres
+class TestPrezoAppWithNotes:
+    """Tests for presentations with speaker notes."""
 
     async def test_notes_extracted_correctly(self, presentation_with_notes):
         """Test that notes are extracted from slides."""
@@ -335,228 +440,48 @@ More content.
             assert "HTML style notes" in app.presentation.slides[2].notes
 
 
-class TestPrezoAppWithImages:
-    """Tests for presentations with images."""
-
-    @pytest.fixture
-    def presentation_with_images(self, tmp_path):
-        """Create a presentation with image references."""
-        # Create a simple test image
-        try:
-            from PIL import Image
-
-            img = Image.new("RGB", (100, 100), color="blue")
-            img_path = tmp_path / "test_image.png"
-            img.save(img_path)
-        except ImportError:
-            pytest.skip("PIL not available")
-
-        pres = tmp_path / "image_pres.md"
-        pres.write_text("""---
-title: Image Test
----
-
-# Slide With Image
-
-![Test Image](test_image.png)
-
----
-
-# Slide With Left Layout
-
-![bg left](test_image.png)
-
-Content on the right.
-
----
-
-# Slide With Right Layout
-
-![bg right:40%](test_image.png)
-
-Content on the left.
-""")
-        return pres
-
-    async def test_images_extracted_from_slides(self, presentation_with_images):
-        """Test that images are extracted from slides."""
-        app = PrezoApp(presentation_with_images)
-        async with app.run_test() as pilot:
-            await pilot.pause()
-
-            assert app.presentation is not None
-            # First slide has inline image
-            assert len(app.presentation.slides[0].images) == 1
-            assert app.presentation.slides[0].images[0].layout == "inline"
-
-            # Second slide has left layout image
-            assert len(app.presentation.slides[1].images) == 1
-            assert app.presentation.slides[1].images[0].layout == "left"
-
-            # Third slide has right layout with custom size
-            assert len(app.presentation.slides[2].images) == 1
-            assert app.presentation.slides[2].images[0].layout == "right"
-            assert app.presentation.slides[2].images[0].size_percent == 40
-
-
-class TestCommandPalette:
-    """Tests for command palette functionality."""
-
-    def test_command_palette_enabled(self):
-        """Test that command palette is enabled on the app."""
-        app = PrezoApp()
-        assert app.ENABLE_COMMAND_PALETTE is True
-        assert app.COMMAND_PALETTE_BINDING == "ctrl+p"
-
-    def test_commands_provider_registered(self):
-        """Test that PrezoCommands provider is registered."""
-        from prezo.app import PrezoCommands
-
-        app = PrezoApp()
-        assert PrezoCommands in app.COMMANDS
-
-    async def test_command_palette_opens(self):
-        """Test that command palette can be opened."""
-        app = PrezoApp()
-        async with app.run_test() as pilot:
-            # Try to open command palette
-            await pilot.press("ctrl+p")
-            await pilot.pause()
-            # The app should have focus somewhere (command palette or main)
-            # Just verify no errors occurred
-            assert app.is_running
-
-
-class TestPrezoCommandsProvider:
-    """Tests for PrezoCommands provider."""
-
-    def test_commands_provider_search_returns_hits(self):
-        """Test that command search returns results."""
-        from prezo.app import PrezoCommands
-
-        # Create a provider and test search
-        # Note: Provider needs an app context, so we test structure
-        PrezoApp()
-
-        # Verify the provider class exists and has the search method
-        assert hasattr(PrezoCommands, "search")
-
-    async def test_navigation_commands_available(self):
-        """Test that navigation commands are available in command palette."""
-        from prezo.app import PrezoCommands
-
-        app = PrezoApp()
-        async with app.run_test():
-            # Create a provider instance
-            provider = PrezoCommands(app.screen, None)
-
-            # Search for navigation commands
-            hits = []
-            async for hit in provider.search("next"):
-                hits.append(hit)
-
-            # Should find "Next Slide" command
-            assert len(hits) > 0
-            names = [str(h.match_display) for h in hits]
-            assert any("Next" in name for name in names)
-
-    async def test_theme_commands_available(self):
-        """Test that theme commands are available in command palette."""
-        from prezo.app import PrezoCommands
-
-        app = PrezoApp()
-        async with app.run_test():
-            provider = PrezoCommands(app.screen, None)
-
-            # Search for theme commands
-            hits = []
-            async for hit in provider.search("theme"):
-                hits.append(hit)
-
-            # Should find multiple theme commands
-            assert len(hits) > 0
-
-    async def test_file_commands_available(self):
-        """Test that file commands are available in command palette."""
-        from prezo.app import PrezoCommands
-
-        app = PrezoApp()
-        async with app.run_test():
-            provider = PrezoCommands(app.screen, None)
-
-            # Search for reload command
-            hits = []
-            async for hit in provider.search("reload"):
-                hits.append(hit)
-
-            # Should find "Reload Presentation" command
-            assert len(hits) > 0
-
-    async def test_next_slide_command_uses_correct_action(self, tmp_path):
-        """Test that Next Slide command calls the correct action."""
-        from prezo.app import PrezoCommands
-
-        pres = tmp_path / "test.md"
-        pres.write_text("# Slide 1\n\n---\n\n# Slide 2\n\n---\n\n# Slide 3")
-
-        app = PrezoApp(pres)
-        async with app.run_test() as pilot:
-            await pilot.pause()
-
-            assert app.current_slide == 0
-
-            provider = PrezoCommands(app.screen, None)
-
-            # Search for next command
-            hits = []
-            async for hit in provider.search("next"):
-                hits.append(hit)
-
-            # Find the "Next Slide" hit and execute its command callback
-            for hit in hits:
-                if "Next" in str(hit.match_display):
-                    # Hit.command is a coroutine function (partial of async _run_action)
-                    await hit.command()
-                    await pilot.pause()
-                    break
-
-            # Should have advanced to next slide
-            assert app.current_slide == 1
+@pytest.fixture(scope="module")
+def presentation_with_lists(tmp_path_factory, build_pres):
+    """Create a test presentation with lists."""
+    pres = tmp_path_factory.mktemp("lists") / "list_pres.md"
+    pres.write_text(
+        build_pres(
+            [
+                "# First Slide\n\n- Item 1\n- Item 2\n- Item 3",
+                "# Second Slide\n\nNo list here, just text.",
+                "# Third Slide\n\n1. First\n2. Second\n3. Third",
+            ],
+            {"title": "List Test"},
+        )
+    )
+    return pres
+
+
+@pytest.fixture(scope="module")
+def presentation_with_layout(tmp_path_factory, build_pres):
+    """Create a test presentation with layout blocks."""
+    pres = tmp_path_factory.mktemp("layout") / "layout_pres.md"
+    pres.write_text(
+        build_pres(
+            [
+                (
+                    "# Slide with Columns\n\n"
+                    "::: columns\n"
+                    "::: column\n- Left 1\n- Left 2\n:::\n"
+                    "::: column\n- Right 1\n- Right 2\n:::\n"
+                    ":::"
+                ),
+                "# Simple List\n\n- Item 1\n- Item 2\n- Item 3",
+            ],
+            {"title": "Layout Test"},
+        )
+    )
+    return pres
 
 
 class TestIncrementalLists:
     """Tests for incremental lists feature."""
 
-    @pytest.fixture
-    def presentation_with_lists(self, tmp_path):
-        """Create a test presentation with lists."""
-        pres = tmp_path / "list_pres.md"
-        pres.write_text("""---
-title: List Test
----
-
-# First Slide
-
-- Item 1
-- Item 2
-- Item 3
-
----
-
-# Second Slide
-
-No list here, just text.
-
----
-
-# Third Slide
-
-1. First
-2. Second
-3. Third
-""")
-        return pres
-
     async def test_incremental_flag_enables_reveal(self, presentation_with_lists):
         """Test that -I flag enables incremental reveal."""
         app = PrezoApp(presentation_with_lists, incremental=True)
@@ -624,7 +549,6 @@ No list here, just text.
 
             # Navigate to second slide (no lists)
             app.current_slide = 1
-            await pilot.pause()
 
             # Should have reveal_index = -1 (show all)
             assert app.reveal_index == -1
@@ -670,37 +594,6 @@ No list here, just text.
             await pilot.press("right")
             assert app.current_slide == 1
 
-    @pytest.fixture
-    def presentation_with_layout(self, tmp_path):
-        """Create a test presentation with layout blocks."""
-        pres = tmp_path / "layout_pres.md"
-        pres.write_text("""---
-title: Layout Test
----
-
-# Slide with Columns
-
-::: columns
-::: column
-- Left 1
-- Left 2
-:::
-::: column
-- Right 1
-- Right 2
-:::
-:::
-
----
-
-# Simple List
-
-- Item 1
-- Item 2
-- Item 3
-""")
-        return pres
-
     async def test_layout_blocks_with_incremental(self, presentation_with_layout):
         """Test that incremental mode works with layout blocks."""
         app = PrezoApp(presentation_with_layout, incremental=True)
@@ -730,3 +623,53 @@ title: Layout Test
             # Second slide has 3 items
             assert app._get_list_count(1) == 3
             assert app.reveal_index == 0
+
+
+@pytest.fixture(scope="module")
+def presentation_with_images(tmp_path_factory, build_pres, sample_image):
+    """Create a presentation with image references."""
+    tmp_path = tmp_path_factory.mktemp("images")
+    shutil.copyfile(sample_image, tmp_path / "test_image.png")
+
+    pres = tmp_path / "image_pres.md"
+    pres.write_text(
+        build_pres(
+            [
+                "# Slide With Image\n\n![Test Image](test_image.png)",
+                (
+                    "# Slide With Left Layout\n\n![bg left](test_image.png)\n\n"
+                    "Content on the right."
+                ),
+                (
+                    "# Slide With Right Layout\n\n![bg right:40%](test_image.png)\n\n"
+                    "Content on the left."
+                ),
+            ],
+            {"title": "Image Test"},
+        )
+    )
+    return pres
+
+
+class TestPrezoAppWithImages:
+    """Tests for presentations with images."""
+
+    async def test_images_extracted_from_slides(self, presentation_with_images):
+        """Test that images are extracted from slides."""
+        app = PrezoApp(presentation_with_images)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+
+            assert app.presentation is not None
+            # First slide has inline image
+            assert len(app.presentation.slides[0].images) == 1
+            assert app.presentation.slides[0].images[0].layout == "inline"
+
+            # Second slide has left layout image
+            assert len(app.presentation.slides[1].images) == 1
+            assert app.presentation.slides[1].images[0].layout == "left"
+
+            # Third slide has right layout with custom size
+            assert len(app.presentation.slides[2].images) == 1
+            assert app.presentation.slides[2].images[0].layout == "right"
+            assert app.presentation.slides[2].images[0].size_percent == 40
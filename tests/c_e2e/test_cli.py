@@ -4,94 +4,122 @@ from __future__ import annotations
 
 import shutil
 import subprocess
-from typing import TYPE_CHECKING
+import sys
+from functools import cache
+from typing import TYPE_CHECKING, NamedTuple
 
 import pytest
 
+from prezo import _validate_file, main
+
 if TYPE_CHECKING:
     from pathlib import Path
 
+_SAMPLE_MD = "# Slide 1\n\n---\n\n# Slide 2\n\n---\n\n# Slide 3"
+
 
-def get_prezo_command():
-    """Get the prezo command path."""
+@cache
+def get_prezo_command() -> tuple[str, ...]:
+    """Get the prezo command path (looked up once per session)."""
     cmd = shutil.which("prezo")
     if cmd:
-        return [cmd]
+        return (cmd,)
     # Fall back to running via uv
     uv = shutil.which("uv")
     if uv:
-        return [uv, "run", "prezo"]
+        return (uv, "run", "prezo")
     pytest.skip("prezo command not found")
 
 
-class TestCLIErrorHandling:
-    """Tests for CLI error handling."""
+@pytest.fixture(scope="session")
+def sample_presentation(tmp_path_factory) -> Path:
+    """A three-slide presentation shared by the export tests."""
+    source = tmp_path_factory.mktemp("pres") / "presentation.md"
+    source.write_text(_SAMPLE_MD)
+    return source
+
+
+class CLIResult(NamedTuple):
+    """Outcome of an in-process prezo CLI run."""
+
+    exit_code: int
+    stdout: str
+    stderr: str
+
 
-    def test_missing_file_shows_friendly_error(self, tmp_path: Path):
-        """Test that missing file shows friendly error message."""
+@pytest.fixture
+def run_cli(monkeypatch, capsys):
+    """Run ``prezo.main`` in-process with the given arguments.
+
+    Avoids an interpreter start per test; the entry-point wiring itself is
+    covered by ``TestCLIEntryPoint``.
+    """
+
+    def invoke(*args: str) -> CLIResult:
+        monkeypatch.setattr(sys, "argv", ["prezo", *args])
+        try:
+            main()
+        except SystemExit as e:
+            code = e.code
+        else:
+            code = 0
+        captured = capsys.readouterr()
+        if not isinstance(code, int):
+            code = 0 if code is None else 1
+        return CLIResult(code, captured.out, captured.err)
+
+    return invoke
+
+
+class TestCLIEntryPoint:
+    """Smoke test for the installed ``prezo`` command."""
+
+    def test_missing_file_exits_with_error(self, tmp_path: Path):
+        """Test that the console script runs and reports errors."""
         cmd = get_prezo_command()
         result = subprocess.run(
             [*cmd, str(tmp_path / "nonexistent.md")],
             check=False,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
+            timeout=30,
         )
         assert result.returncode == 1
-        assert "error:" in result.stderr
         assert "file not found" in result.stderr
-        assert "Make sure the file exists" in result.stderr
 
-    def test_export_missing_file_shows_error(self, tmp_path: Path):
-        """Test that export with missing file shows error."""
-        cmd = get_prezo_command()
-        result = subprocess.run(
-            [*cmd, "-e", "png", str(tmp_path / "missing.md")],
-            check=False,
-            capture_output=True,
-            text=True,
-        )
-        assert result.returncode == 1
-        assert "error:" in result.stderr
 
-    def test_export_without_file_shows_error(self):
-        """Test that export without file argument shows error."""
-        cmd = get_prezo_command()
-        result = subprocess.run(
-            [*cmd, "-e", "png"],
-            check=False,
-            capture_output=True,
-            text=True,
-        )
-        assert result.returncode == 1
-        assert "error:" in result.stderr
-        assert "requires a presentation file" in result.stderr
+class TestCLIErrorHandling:
+    """Tests for CLI error handling."""
 
-    def test_directory_instead_of_file_shows_error(self, tmp_path: Path):
-        """Test that providing a directory shows friendly error."""
-        cmd = get_prezo_command()
-        result = subprocess.run(
-            [*cmd, str(tmp_path)],
-            check=False,
-            capture_output=True,
-            text=True,
-        )
-        assert result.returncode == 1
+    @pytest.mark.parametrize(
+        ("args", "messages"),
+        [
+            (
+                ["{tmp}/nonexistent.md"],
+                ["file not found", "Make sure the file exists"],
+            ),
+            (["-e", "png", "{tmp}/missing.md"], []),
+            (["-e", "png"], ["requires a presentation file"]),
+            (["{tmp}"], ["expected a file, got a directory"]),
+        ],
+        ids=["missing-file", "export-missing-file", "export-no-file", "directory"],
+    )
+    def test_error_exits_with_message(self, run_cli, tmp_path: Path, args, messages):
+        """Test that bad arguments exit with a friendly error message."""
+        result = run_cli(*(arg.format(tmp=tmp_path) for arg in args))
+        assert result.exit_code == 1
         assert "error:" in result.stderr
-        assert "expected a file, got a directory" in result.stderr
+        for message in messages:
+            assert message in result.stderr
 
-    def test_non_md_file_shows_warning(self, tmp_path: Path):
+    def test_non_md_file_shows_warning(self, run_cli, tmp_path: Path):
         """Test that non-.md file shows warning but continues."""
         # Create a file with wrong extension
         test_file = tmp_path / "presentation.txt"
         test_file.write_text("# Slide 1")
 
-        cmd = get_prezo_command()
-        result = subprocess.run(
-            [*cmd, "-e", "svg", str(test_file)],
-            check=False,
-            capture_output=True,
-            text=True,
-        )
+        result = run_cli("-e", "svg", str(test_file), "-o", str(tmp_path / "out"))
         # Should show warning but still export
         assert "warning:" in result.stderr
         assert "does not have a .md extension" in result.stderr
@@ -100,53 +128,35 @@ class TestCLIErrorHandling:
 class TestPNGSVGExportCLI:
     """Tests for PNG/SVG export via CLI."""
 
-    def test_png_export_all_slides(self, tmp_path: Path):
+    def test_png_export_all_slides(
+        self, run_cli, sample_presentation: Path, tmp_path: Path
+    ):
         """Test exporting all slides to PNG via CLI."""
-        source = tmp_path / "presentation.md"
-        source.write_text("# Slide 1\n\n---\n\n# Slide 2")
+        pytest.importorskip("cairosvg")
         output_dir = tmp_path / "output"
 
-        cmd = get_prezo_command()
-        result = subprocess.run(
-            [*cmd, "-e", "png", str(source), "-o", str(output_dir)],
-            check=False,
-            capture_output=True,
-            text=True,
-        )
+        result = run_cli("-e", "png", str(sample_presentation), "-o", str(output_dir))
 
-        assert result.returncode == 0
+        assert result.exit_code == 0
         assert "Exported" in result.stdout or "Exported" in result.stderr
 
-    def test_svg_export_single_slide(self, tmp_path: Path):
+    def test_svg_export_single_slide(
+        self, run_cli, sample_presentation: Path, tmp_path: Path
+    ):
         """Test exporting single slide to SVG via CLI."""
-        source = tmp_path / "presentation.md"
-        source.write_text("# Slide 1\n\n---\n\n# Slide 2\n\n---\n\n# Slide 3")
         output = tmp_path / "slide.svg"
 
-        cmd = get_prezo_command()
-        result = subprocess.run(
-            [*cmd, "-e", "svg", str(source), "--slide", "2", "-o", str(output)],
-            check=False,
-            capture_output=True,
-            text=True,
+        result = run_cli(
+            "-e", "svg", str(sample_presentation), "--slide", "2", "-o", str(output)
         )
 
-        assert result.returncode == 0
+        assert result.exit_code == 0
         assert output.exists()
 
-    def test_invalid_slide_number_shows_error(self, tmp_path: Path):
+    def test_invalid_slide_number_shows_error(self, run_cli, sample_presentation):
         """Test that invalid slide number shows error."""
-        source = tmp_path / "presentation.md"
-        source.write_text("# Slide 1")
-
-        cmd = get_prezo_command()
-        result = subprocess.run(
-            [*cmd, "-e", "svg", str(source), "--slide", "99"],
-            check=False,
-            capture_output=True,
-            text=True,
-        )
-        assert result.returncode != 0
+        result = run_cli("-e", "svg", str(sample_presentation), "--slide", "99")
+        assert result.exit_code != 0
         assert "Invalid slide number" in result.stderr
 
 
@@ -155,8 +165,6 @@ class TestValidateFile:
 
     def test_validate_existing_md_file(self, tmp_path: Path):
         """Test validation of existing .md file."""
-        from prezo import _validate_file
-
         test_file = tmp_path / "test.md"
         test_file.write_text("# Test")
 
@@ -165,8 +173,6 @@ class TestValidateFile:
 
     def test_validate_markdown_extension(self, tmp_path: Path):
         """Test validation of .markdown extension."""
-        from prezo import _validate_file
-
         test_file = tmp_path / "test.markdown"
         test_file.write_text("# Test")
 
@@ -175,8 +181,6 @@ class TestValidateFile:
 
     def test_validate_resolves_path(self, tmp_path: Path):
         """Test that _validate_file resolves relative paths."""
-        from prezo import _validate_file
-
         test_file = tmp_path / "test.md"
         test_file.write_text("# Test")
 
@@ -10,30 +10,42 @@ Run specific test types:
     uv run pytest -m integration       # Run only integration tests
     uv run pytest -m e2e               # Run only e2e tests
     uv run pytest tests/a_unit/        # Run by directory
+    uv run pytest -n auto              # Run in parallel (pytest-xdist)
 """
 
 from __future__ import annotations
 
-from pathlib import Path
+from typing import TYPE_CHECKING
 
 import pytest
 
+from prezo.parser import Presentation, Slide
 
-def pytest_collection_modifyitems(config, items):
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# Smallest valid PNG (1x1 transparent pixel), for tests that need an image file
+MINIMAL_PNG = bytes.fromhex(
+    "89504e470d0a1a0a0000000d49484452000000010000000108060000001f15c489"
+    "0000000a49444154789c63000100000500010d0a2db40000000049454e44ae426082"
+)
+
+# Marker applied to tests under each test pyramid directory
+_DIRECTORY_MARKERS = {
+    "a_unit": pytest.mark.unit,
+    "b_integration": pytest.mark.integration,
+    "c_e2e": pytest.mark.e2e,
+}
+
+
+def pytest_collection_modifyitems(items):
     """Automatically apply markers based on test directory."""
-    assert config
     for item in items:
-        # Get the path relative to tests/
-        test_path = Path(item.fspath)
-        parts = test_path.parts
-
-        # Apply markers based on directory
-        if "a_unit" in parts:
-            item.add_marker(pytest.mark.unit)
-        elif "b_integration" in parts:
-            item.add_marker(pytest.mark.integration)
-        elif "c_e2e" in parts:
-            item.add_marker(pytest.mark.e2e)
+        parts = set(item.path.parts)
+        for directory, marker in _DIRECTORY_MARKERS.items():
+            if directory in parts:
+                item.add_marker(marker)
+                break
 
 
 # -----------------------------------------------------------------------------
@@ -41,10 +53,12 @@ def pytest_collection_modifyitems(config, items):
 # -----------------------------------------------------------------------------
 
 
-@pytest.fixture
-def sample_presentation_md() -> str:
-    """Sample MARP-style presentation markdown."""
-    return """---
+# Presentation markdown by flavor:
+# - "sample": MARP-style presentation with frontmatter and presenter notes
+# - "marp": presentation with MARP-specific directives
+# - "simple": minimal presentation without frontmatter
+_PRES_FIXTURES = {
+    "sample": """---
 title: Test Presentation
 theme: default
 ---
@@ -68,13 +82,8 @@ Some content here.
 
 ???
 These are presenter notes.
-"""
-
-
-@pytest.fixture
-def marp_presentation_md() -> str:
-    """Sample presentation with MARP-specific directives."""
-    return """---
+""",
+    "marp": """---
 marp: true
 header: MARP Header Title
 theme: gaia
@@ -98,13 +107,89 @@ theme: gaia
 </div>
 
 <!-- _header: Custom Header -->
-"""
+""",
+    "simple": """# Only Slide
+
+Just one slide with no metadata.
+""",
+}
 
 
 @pytest.fixture
-def simple_presentation_md() -> str:
-    """Minimal presentation without frontmatter."""
-    return """# Only Slide
+def presentation_md(request) -> str:
+    """Presentation markdown, "sample" unless another flavor is requested.
 
-Just one slide with no metadata.
-"""
+    Select a flavor with indirect parametrization::
+
+        @pytest.mark.parametrize("presentation_md", ["marp"], indirect=True)
+    """
+    return _PRES_FIXTURES[getattr(request, "param", "sample")]
+
+
+def _build_pres(slides: list[str], frontmatter: dict[str, str] | None = None) -> str:
+    """Join slide bodies into presentation markdown.
+
+    Args:
+        slides: Markdown body of each slide, without separators.
+        frontmatter: Optional flat mapping written as YAML frontmatter.
+
+    Returns:
+        Presentation markdown with slides separated by ``---``.
+
+    """
+    body = "\n\n---\n\n".join(slide.strip() for slide in slides) + "\n"
+    if not frontmatter:
+        return body
+    header = "".join(f"{key}: {value}\n" for key, value in frontmatter.items())
+    return f"---\n{header}---\n\n{body}"
+
+
+@pytest.fixture(scope="session")
+def build_pres():
+    """Builder for presentation markdown from a list of slide bodies.
+
+    Usage::
+
+        build_pres(["# One", "# Two"], {"title": "Demo"})
+    """
+    return _build_pres
+
+
+def _make_presentation(*slides: str, title: str = "Test") -> Presentation:
+    """Build a presentation directly from slide contents, without parsing.
+
+    Args:
+        *slides: Display content of each slide.
+        title: Presentation title.
+
+    Returns:
+        A presentation whose slides carry the given content as both
+        display and raw content.
+
+    """
+    return Presentation(
+        slides=[
+            Slide(content=content, index=i, raw_content=content)
+            for i, content in enumerate(slides)
+        ],
+        title=title,
+    )
+
+
+@pytest.fixture(scope="session")
+def make_presentation():
+    """Builder for ``Presentation`` objects, for tests that don't exercise parsing.
+
+    Usage::
+
+        make_presentation("# One\n\nBody", "# Two", title="Demo")
+    """
+    return _make_presentation
+
+
+@pytest.fixture(scope="session")
+def sample_image(tmp_path_factory) -> Path:
+    """A minimal valid PNG file, written once per session."""
+    path = tmp_path_factory.mktemp("images") / "test.png"
+    path.write_bytes(MINIMAL_PNG)
+    return path